@@ -0,0 +1,58 @@
+"""
+Benchmark: per-record parse_product_data vs. the columnar batch parser.
+
+Streams a synthetic catalog in chunks, parses every chunk both ways (checking
+that the models are identical) and reports records per second, for the
+columnar structure alone and with model validation. Only parsing is timed, so
+the catalog never has to fit in memory.
+
+Usage:
+    python benchmarks/bench_batch_parser.py [--records N] [--chunk-size N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.catalog import iter_catalog
+from src.batch_parser import columns_to_models, parse_columns
+from src.sharding import _chunked
+from src.tools import parse_product_data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=1_000_000)
+    parser.add_argument('--chunk-size', type=int, default=4096)
+    args = parser.parse_args(argv)
+
+    parse_one = parse_product_data.func
+    row_s = columns_s = models_s = 0.0
+    for chunk in _chunked(iter_catalog(args.records), args.chunk_size):
+        start = time.perf_counter()
+        rows = [parse_one(raw) for raw in chunk]
+        row_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        columns = parse_columns(chunk)
+        columns_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        models = columns_to_models(columns)
+        models_s += time.perf_counter() - start
+
+        assert rows == models
+
+    columnar_s = columns_s + models_s
+    print(f"{'parser':<24}{'seconds':>10}{'records/s':>14}")
+    for name, seconds in (("per-record", row_s), ("columnar (columns)", columns_s),
+                          ("columnar (models)", columnar_s)):
+        print(f"{name:<24}{seconds:>10.2f}{args.records / seconds:>14.0f}")
+    print(f"\nSpeed-up: {row_s / columnar_s:.2f}x to models, "
+          f"{row_s / columns_s:.2f}x to columns over {args.records} records")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Micro-benchmark: per-call overhead of rebuilding the chain / graph.
+
+Compares building the LangChain chain (and compiling the LangGraph workflow)
+on every call against reusing the cached instances.
+
+Usage:
+    python benchmarks/bench_chain_cache.py [--iterations N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import RAW_PRODUCT
+from src.orchestrator import create_orchestrator
+from src.graph import create_graph, get_graph
+
+
+def _per_call_ms(fn, iterations: int) -> float:
+    """Average wall time of fn() in milliseconds."""
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=500)
+    args = parser.parse_args(argv)
+    n = args.iterations
+
+    orchestrator = create_orchestrator()
+    state = {"raw_input": RAW_PRODUCT}
+
+    results = {
+        "chain: rebuild per call": _per_call_ms(
+            lambda: orchestrator.create_chain().invoke(state), n),
+        "chain: cached": _per_call_ms(
+            lambda: orchestrator.chain.invoke(state), n),
+        "graph: compile per call": _per_call_ms(
+            lambda: create_graph().invoke(state), n),
+        "graph: cached": _per_call_ms(
+            lambda: get_graph().invoke(state), n),
+    }
+
+    print(f"{'case':<28}{'ms/call':>10}")
+    for name, ms in results.items():
+        print(f"{name:<28}{ms:>10.3f}")
+
+    chain_saving = results["chain: rebuild per call"] - results["chain: cached"]
+    graph_saving = results["graph: compile per call"] - results["graph: cached"]
+    print(f"\nChain build overhead saved: {chain_saving:.3f} ms/call")
+    print(f"Graph compile overhead saved: {graph_saving:.3f} ms/call")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark: LangChain tool-wrapper overhead vs. direct function calls.
+
+Runs the same synthetic catalog through the orchestrator with agents invoking
+their tools normally and in direct mode, and reports the per-product saving.
+
+Usage:
+    python benchmarks/bench_direct_mode.py [--products N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.catalog import make_catalog
+from src.orchestrator import create_orchestrator
+
+
+def _per_product_us(orchestrator, catalog) -> float:
+    """Average wall time per product in microseconds."""
+    orchestrator.run(catalog[0])  # warm-up
+    start = time.perf_counter()
+    for _ in orchestrator.run_batch(catalog):
+        pass
+    return (time.perf_counter() - start) * 1e6 / len(catalog)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--products', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    catalog = make_catalog(args.products)
+    tool_us = _per_product_us(create_orchestrator(), catalog)
+    direct_us = _per_product_us(create_orchestrator(direct=True), catalog)
+
+    print(f"{'mode':<20}{'us/product':>12}{'products/s':>12}")
+    for name, us in (("tool.invoke", tool_us), ("direct", direct_us)):
+        print(f"{name:<20}{us:>12.1f}{1e6 / us:>12.1f}")
+    print(f"\nSaving: {tool_us - direct_us:.1f} us/product "
+          f"({(tool_us - direct_us) / tool_us:.0%})")
+
+
+if __name__ == '__main__':
+    main()
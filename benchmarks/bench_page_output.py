@@ -0,0 +1,117 @@
+"""
+Benchmark: page output, stdlib json vs. src.serialization, full vs. normalized.
+
+Generates page sets for a synthetic catalog with the agents called directly
+and writes every product with each NDJSON writer variant: the previous
+stdlib encoder and src.serialization (pydantic's Rust serializer / orjson),
+each in the default layout and in normalized mode (questions stored once
+per product, referenced by id). Pretty (indented) encoding, as used for
+--format json, is timed in memory. Only the writes and encodes are timed;
+reports bytes per product and MB/s.
+
+Usage:
+    python benchmarks/bench_page_output.py [--products N] [--trusted]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.catalog import iter_catalog
+from src.agents import get_all_agents
+from src.serialization import dumps, orjson
+from src.streaming import NDJSONPageWriter, normalize_pages, page_to_dict
+
+
+class LegacyNDJSONPageWriter(NDJSONPageWriter):
+    """NDJSONPageWriter with the previous stdlib encoding, for comparison."""
+
+    def write(self, outputs):
+        if self.normalized:
+            outputs = normalize_pages(outputs)
+        for key, buffer in self._buffers.items():
+            line = json.dumps(page_to_dict(outputs[key]), ensure_ascii=False, separators=(',', ':'))
+            buffer.append(line.encode('utf-8') + b'\n')
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+
+def iter_outputs(products: int, trusted: bool):
+    """Page sets for a synthetic catalog, built without the chain."""
+    agents = get_all_agents(direct=True, trusted=trusted)
+    parser, questions = agents["parser"], agents["question_generator"]
+    blocks, comparison, assembly = agents["content_blocks"], agents["comparison"], agents["assembly"]
+    for raw in iter_catalog(products):
+        model = parser.invoke(raw)
+        yield assembly.invoke(model, questions.invoke(model), blocks.invoke(model),
+                              comparison.invoke(model))
+
+
+def _pretty_stdlib(pages):
+    return [json.dumps(page_to_dict(p), ensure_ascii=False, indent=2).encode('utf-8') for p in pages]
+
+
+def _pretty_fast(pages):
+    return [dumps(p, pretty=True) for p in pages]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--products', type=int, default=100000)
+    parser.add_argument('--trusted', action='store_true', help="Use trusted (dict) pages")
+    args = parser.parse_args(argv)
+
+    variants = {
+        "ndjson stdlib": (LegacyNDJSONPageWriter, False),
+        "ndjson fast": (NDJSONPageWriter, False),
+        "normalized stdlib": (LegacyNDJSONPageWriter, True),
+        "normalized fast": (NDJSONPageWriter, True),
+    }
+    pretty = {"pretty stdlib": _pretty_stdlib, "pretty fast": _pretty_fast}
+    seconds = dict.fromkeys(list(variants) + list(pretty), 0.0)
+    sizes = dict.fromkeys(pretty, 0)
+    timer = time.perf_counter
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writers = {
+            name: cls(os.path.join(tmp, name.replace(' ', '_')), normalized=normalized).open()
+            for name, (cls, normalized) in variants.items()
+        }
+        count = 0
+        for outputs in iter_outputs(args.products, args.trusted):
+            for name, writer in writers.items():
+                start = timer()
+                writer.write(outputs)
+                seconds[name] += timer() - start
+            pages = list(outputs.values())
+            for name, encode in pretty.items():
+                start = timer()
+                encoded = encode(pages)
+                seconds[name] += timer() - start
+                sizes[name] += sum(map(len, encoded))
+            count += 1
+        for name, writer in writers.items():
+            start = timer()
+            writer.close()
+            seconds[name] += timer() - start
+            sizes[name] = sum(os.path.getsize(os.path.join(writer.output_dir, f))
+                              for f in os.listdir(writer.output_dir))
+
+    print(f"{count} products, {'trusted dict' if args.trusted else 'pydantic'} pages, "
+          f"orjson {'available' if orjson is not None else 'not installed'}\n")
+    print(f"{'variant':<20}{'us/product':>12}{'bytes/product':>15}{'MB/s':>8}")
+    for name in seconds:
+        print(f"{name:<20}{seconds[name] * 1e6 / count:>12.1f}{sizes[name] / count:>15.0f}"
+              f"{sizes[name] / seconds[name] / 1e6:>8.1f}")
+    print(f"\nNDJSON: {seconds['ndjson stdlib'] / seconds['ndjson fast']:.1f}x, "
+          f"normalized: {seconds['normalized stdlib'] / seconds['normalized fast']:.1f}x, "
+          f"pretty: {seconds['pretty stdlib'] / seconds['pretty fast']:.1f}x faster than stdlib json")
+
+
+if __name__ == '__main__':
+    main()
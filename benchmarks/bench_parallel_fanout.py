@@ -0,0 +1,103 @@
+"""
+Benchmark: serial vs. fanned-out generation step under simulated I/O.
+
+Covers both the orchestrator chain and the LangGraph workflow (linear vs.
+fanned-out). Each generation agent / node is wrapped with a fixed sleep to
+stand in for an LLM or network call. With the branches fanned out, per-product latency should
+approach the slowest branch rather than the sum of all branches.
+
+Usage:
+    python benchmarks/bench_parallel_fanout.py [--delay-ms MS] [--iterations N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import RAW_PRODUCT
+from src.orchestrator import create_orchestrator
+from src import graph as graph_module
+
+
+def _with_delay(agent, delay: float):
+    """Wrap agent.invoke so every call sleeps for `delay` seconds first."""
+    invoke = agent.invoke
+
+    def delayed(*args, **kwargs):
+        time.sleep(delay)
+        return invoke(*args, **kwargs)
+
+    agent.invoke = delayed
+
+
+def _per_call_ms(fn, iterations: int) -> float:
+    """Average wall time of fn() in milliseconds."""
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def bench_orchestrator(delay: float, iterations: int):
+    """Orchestrator chain with max_concurrency=1 (serial) vs. unbounded."""
+    results = {}
+    for label, max_concurrency in (("serial", 1), ("parallel", None)):
+        orchestrator = create_orchestrator(max_concurrency=max_concurrency)
+        for agent in (orchestrator.question_generator,
+                      orchestrator.content_blocks,
+                      orchestrator.comparison):
+            _with_delay(agent, delay)
+        results[f"orchestrator: {label}"] = _per_call_ms(
+            lambda: orchestrator.run(RAW_PRODUCT), iterations)
+    return results
+
+
+def bench_graph(delay: float, iterations: int):
+    """LangGraph workflow wired linearly vs. fanned out from the parser."""
+    originals = {
+        name: getattr(graph_module, name)
+        for name in ("question_generator_node", "content_blocks_node")
+    }
+
+    def delayed(node):
+        def wrapper(state):
+            time.sleep(delay)
+            return node(state)
+        return wrapper
+
+    results = {}
+    try:
+        for name, node in originals.items():
+            setattr(graph_module, name, delayed(node))
+        for label, parallel in (("linear", False), ("fan-out", True)):
+            graph = graph_module.create_graph(parallel=parallel)
+            state = {"raw_input": RAW_PRODUCT}
+            results[f"graph: {label}"] = _per_call_ms(
+                lambda: graph.invoke(state), iterations)
+    finally:
+        for name, node in originals.items():
+            setattr(graph_module, name, node)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--delay-ms', type=float, default=20.0)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args(argv)
+    delay = args.delay_ms / 1000
+
+    results = bench_orchestrator(delay, args.iterations)
+    results.update(bench_graph(delay, args.iterations))
+
+    print(f"Simulated I/O per branch: {args.delay_ms:.1f} ms\n")
+    print(f"{'case':<28}{'ms/call':>10}")
+    for name, ms in results.items():
+        print(f"{name:<28}{ms:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: compiled multi-currency price parsing vs. the previous try/except path.
+
+The legacy parser below is the previous parse_product_data price handling,
+kept here as the reference. The headline is the cold path: each distinct text
+of a dirty price column parsed once. The full column, where repeated rare
+texts hit the parse cache, follows. Every pass starts from an empty cache and
+the best of 5 is reported, with how many prices each parser recovers.
+
+Usage:
+    python benchmarks/bench_price_parsing.py [--values N] [--dirty FRACTION]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pricing import _parse_price_text, parse_price
+
+CLEAN = ["₹{}", "{}"]
+DIRTY = ["Rs. {:,}", "₹{:,}.00", "${}", "INR {:,}", "Rs {}/-", "MRP: ₹ {}", "{} €", "N/A", "", "call for price"]
+
+
+def legacy_parse_price(p):
+    """Previous implementation: strip a leading ₹, let float() decide."""
+    try:
+        if isinstance(p, str) and p.startswith('₹'):
+            p = p.replace('₹', '').strip()
+        return float(p)
+    except Exception:
+        return None
+
+
+def make_prices(count: int, dirty: float, seed: int = 42):
+    """Price column with the price distribution of benchmarks/catalog.py."""
+    rng = random.Random(seed)
+    return [
+        rng.choice(DIRTY if rng.random() < dirty else CLEAN).format(rng.randint(199, 2999))
+        for _ in range(count)
+    ]
+
+
+def _run(fn, values, repeat: int = 5):
+    """Best of ``repeat`` passes, each starting from an empty parse cache."""
+    best = float('inf')
+    for _ in range(repeat):
+        _parse_price_text.cache_clear()
+        start = time.perf_counter()
+        parsed = [fn(v) for v in values]
+        best = min(best, time.perf_counter() - start)
+    return best, sum(p is not None for p in parsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--values', type=int, default=1_000_000)
+    parser.add_argument('--dirty', type=float, default=0.5,
+                        help="Fraction of prices in non-trivial formats")
+    args = parser.parse_args(argv)
+
+    values = make_prices(args.values, args.dirty)
+    distinct = list(dict.fromkeys(values))
+    print(f"{'parser':<36}{'values/s':>14}{'parsed':>10}")
+    speedups = []
+    for label, column in ((f"cold, {len(distinct)} distinct", distinct), (f"column, {len(values)}", values)):
+        legacy_s, legacy_ok = _run(legacy_parse_price, column)
+        compiled_s, compiled_ok = _run(parse_price, column)
+        for name, seconds, ok in ((f"legacy ({label})", legacy_s, legacy_ok),
+                                  (f"compiled ({label})", compiled_s, compiled_ok)):
+            print(f"{name:<36}{len(column) / seconds:>14.0f}{ok / len(column):>10.1%}")
+        speedups.append(legacy_s / compiled_s)
+    print(f"\nSpeed-up: {speedups[0]:.2f}x cold, {speedups[1]:.2f}x over the column")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: all-pairs comparison of a category, Python sets vs. sparse matrices.
+
+Compares every ordered pair of products with generate_comparison_block's set
+logic and with SimilarityMatrix, checks that the counts agree and reports
+pairs per second. Requires numpy and scipy.
+
+Usage:
+    python benchmarks/bench_similarity.py [--products N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.catalog import make_catalog
+from src.similarity import SimilarityMatrix
+from src.tools import generate_comparison_block, parse_product_data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--products', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    products = [parse_product_data.func(raw) for raw in make_catalog(args.products)]
+    pairs = len(products) ** 2
+    compare = generate_comparison_block.func
+    others = [{"key_ingredients": p.key_ingredients, "price": p.price} for p in products]
+
+    start = time.perf_counter()
+    python_common = [[len(compare(a, b)["common_ingredients"]) for b in others] for a in products]
+    python_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = SimilarityMatrix(products).counts()
+    matrix_s = time.perf_counter() - start
+
+    assert counts["common_ingredients"].tolist() == python_common
+
+    print(f"{'path':<20}{'seconds':>10}{'pairs/s':>14}")
+    for name, seconds in (("python sets", python_s), ("sparse matrix", matrix_s)):
+        print(f"{name:<20}{seconds:>10.3f}{pairs / seconds:>14.0f}")
+    print(f"\nSpeed-up: {python_s / matrix_s:.1f}x over {pairs} pairs")
+
+
+if __name__ == '__main__':
+    main()
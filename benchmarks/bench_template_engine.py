@@ -0,0 +1,111 @@
+"""
+Benchmark: compiled TemplateAgent render plans vs. per-render regex walking.
+
+The legacy interpreter below is the previous TemplateAgent implementation,
+kept here as the reference for both speed and output equivalence.
+
+Usage:
+    python benchmarks/bench_template_engine.py [--renders N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.block_agent import BlockAgent
+from src.agents.parser_agent import ParserAgent
+from src.agents.qgen_agent import QuestionGenAgent
+from src.agents.template_agent import TemplateAgent
+from src.main import RAW_PRODUCT
+
+# Legacy-style templates, as used with TemplateAgent
+TEMPLATES = {
+    'faq': {
+        'title': 'FAQ - {{model.product_name}}',
+        'questions': 'questions'
+    },
+    'product_page': {
+        'name': '{{model.product_name}}',
+        'tagline': '{{model.benefits}} with {{model.concentration}}',
+        'price': '{{model.price}}',
+        'concentration': '{{model.concentration}}',
+        'ingredients': {'block': 'ingredients_block'},
+        'benefits': {'block': 'benefits_block'},
+        'usage': {'block': 'usage_block'},
+        'safety': {'block': 'safety_block'},
+        'meta': {'source': 'catalog', 'label': '{{model.product_name}} ({{model.price}})'},
+        'questions': 'questions'
+    },
+}
+
+
+class LegacyTemplateAgent:
+    """Previous implementation: re-walks the template with regex on every render."""
+
+    def __init__(self, block_interface):
+        self.block = block_interface
+
+    def render(self, template_def: Dict[str, Any], model: Dict[str, Any], questions=None,
+               name=None) -> Dict[str, Any]:
+        return {field: self._process_value(spec, model, questions) for field, spec in template_def.items()}
+
+    def _process_value(self, spec: Any, model: Dict[str, Any], questions=None) -> Any:
+        if isinstance(spec, str):
+            if '{{' in spec and '}}' in spec:
+                result = spec
+                pattern = r'\{\{model\.([a-z_]+)\}\}'
+                for match in re.finditer(pattern, spec):
+                    key = match.group(1)
+                    value = model.get(key)
+                    result = result.replace(match.group(0), str(value) if value is not None else '')
+                return result
+            elif spec == 'questions' and questions is not None:
+                return questions
+            else:
+                return spec
+        elif isinstance(spec, dict):
+            if spec.get('block'):
+                fn = getattr(self.block, spec['block'])
+                if spec['block'] == 'compare_ingredients_block':
+                    return fn(model, spec.get('with'))
+                return fn(model)
+            return {k: self._process_value(v, model, questions) for k, v in spec.items()}
+        return spec
+
+
+def _renders_per_s(agent, model, questions, renders: int) -> float:
+    start = time.perf_counter()
+    for _ in range(renders):
+        for name, template in TEMPLATES.items():
+            agent.render(template, model, questions=questions, name=name)
+    return renders * len(TEMPLATES) / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--renders', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    model = ParserAgent().run(RAW_PRODUCT)
+    questions = QuestionGenAgent().run(model)
+    block = BlockAgent()
+    legacy, compiled = LegacyTemplateAgent(block), TemplateAgent(block)
+
+    for template in TEMPLATES.values():
+        assert legacy.render(template, model, questions) == compiled.render(template, model, questions)
+
+    legacy_rate = _renders_per_s(legacy, model, questions, args.renders)
+    compiled_rate = _renders_per_s(compiled, model, questions, args.renders)
+
+    print(f"{'engine':<20}{'renders/s':>14}")
+    print(f"{'legacy (regex)':<20}{legacy_rate:>14.0f}")
+    print(f"{'compiled':<20}{compiled_rate:>14.0f}")
+    print(f"\nSpeed-up: {compiled_rate / legacy_rate:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
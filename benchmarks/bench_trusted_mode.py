@@ -0,0 +1,74 @@
+"""
+Benchmark: validated pydantic questions and pages vs. the trusted compact path.
+
+Runs the agents of the pipeline directly (no chain) over a synthetic catalog
+with full pydantic validation and in trusted mode (CompactQuestion, dict
+pages), checks that both produce the same page data, and reports time and
+memory retained per product.
+
+Usage:
+    python benchmarks/bench_trusted_mode.py [--products N]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.catalog import make_catalog
+from src.agents import get_all_agents
+
+
+def _pipeline(agents):
+    parser, questions = agents["parser"], agents["question_generator"]
+    blocks, comparison, assembly = agents["content_blocks"], agents["comparison"], agents["assembly"]
+
+    def run(raw):
+        model = parser.invoke(raw)
+        return assembly.invoke(model, questions.invoke(model), blocks.invoke(model),
+                               comparison.invoke(model))
+    return run
+
+
+def _measure(run, catalog):
+    """(us per product, KiB allocated per product)."""
+    run(catalog[0])  # warm-up
+    start = time.perf_counter()
+    for raw in catalog:
+        run(raw)
+    us = (time.perf_counter() - start) * 1e6 / len(catalog)
+
+    tracemalloc.start()
+    outputs = [run(raw) for raw in catalog]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del outputs
+    return us, allocated / 1024 / len(catalog)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--products', type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    catalog = make_catalog(args.products)
+    validated = _pipeline(get_all_agents(direct=True))
+    trusted = _pipeline(get_all_agents(trusted=True))
+    for raw in catalog[:100]:
+        a, b = validated(raw), trusted(raw)
+        assert all(a[page].model_dump() == b[page] for page in a)
+
+    print(f"{'mode':<20}{'us/product':>12}{'KiB/product':>13}")
+    results = [(name, *_measure(run, catalog)) for name, run in
+               (("validated", validated), ("trusted", trusted))]
+    for name, us, kib in results:
+        print(f"{name:<20}{us:>12.1f}{kib:>13.1f}")
+    (_, v_us, v_kib), (_, t_us, t_kib) = results
+    print(f"\nSaving: {v_us - t_us:.1f} us/product ({(v_us - t_us) / v_us:.0%}), "
+          f"{v_kib - t_kib:.1f} KiB/product retained")
+
+
+if __name__ == '__main__':
+    main()
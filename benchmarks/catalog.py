@@ -0,0 +1,57 @@
+"""
+Synthetic product catalogs for benchmarks.
+
+Products vary in ingredient and skin-type list lengths so that list-heavy code
+paths (parsing, ingredient roles, comparisons) are exercised realistically.
+Catalogs are deterministic for a given size and seed.
+"""
+import random
+from typing import Dict, Any, Iterator, List
+
+INGREDIENTS = [
+    "Vitamin C", "Hyaluronic Acid", "Niacinamide", "Retinol", "Ferulic Acid",
+    "Vitamin E", "Glycerin", "Squalane", "Ceramide NP", "Peptides",
+    "Salicylic Acid", "Glycolic Acid", "Lactic Acid", "Zinc PCA", "Panthenol",
+    "Allantoin", "Centella Asiatica", "Green Tea Extract", "Licorice Root",
+    "Azelaic Acid", "Bakuchiol", "Aloe Vera", "Kojic Acid", "Arbutin",
+]
+
+SKIN_TYPES = ["Oily", "Dry", "Combination", "Normal", "Sensitive", "Acne-prone"]
+
+BENEFITS = [
+    "Brightening", "Fades dark spots", "Hydration", "Anti-aging",
+    "Pore minimizing", "Barrier repair", "Soothing", "Exfoliation",
+]
+
+FORMS = ["Serum", "Cream", "Gel", "Toner", "Essence", "Lotion"]
+
+
+def synthetic_product(rng: random.Random, index: int) -> Dict[str, Any]:
+    """One raw product dict in the same shape as src.main.RAW_PRODUCT."""
+    ingredients = rng.sample(INGREDIENTS, rng.randint(1, 12))
+    skin_types = rng.sample(SKIN_TYPES, rng.randint(1, len(SKIN_TYPES)))
+    benefits = rng.sample(BENEFITS, rng.randint(1, 4))
+    form = rng.choice(FORMS)
+    return {
+        'Product Name': f"{ingredients[0]} {form} #{index}",
+        'Concentration': f"{rng.randint(1, 20)}% {ingredients[0]}",
+        'Skin Type': ", ".join(skin_types),
+        'Key Ingredients': ", ".join(ingredients),
+        'Benefits': ", ".join(benefits),
+        'How to Use': f"Apply {rng.randint(1, 4)} drops {rng.choice(['in the morning', 'at night', 'twice daily'])}",
+        'Side Effects': rng.choice(["Mild tingling for sensitive skin", "None reported", "Possible dryness"]),
+        'Price': f"₹{rng.randint(199, 2999)}",
+        'Category': form,
+    }
+
+
+def iter_catalog(size: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Lazily generate a synthetic catalog of `size` products."""
+    rng = random.Random(seed)
+    for index in range(size):
+        yield synthetic_product(rng, index)
+
+
+def make_catalog(size: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Materialized synthetic catalog of `size` products."""
+    return list(iter_catalog(size, seed))
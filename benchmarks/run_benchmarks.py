@@ -0,0 +1,214 @@
+"""
+Benchmark suite: throughput and latency of every pipeline stage.
+
+Runs each case over synthetic catalogs (see benchmarks/catalog.py), saves the
+results as JSON, and optionally compares them against a previous run to flag
+regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py                       # sizes 1, 1000
+    python benchmarks/run_benchmarks.py --sizes 1,1000,100000
+    python benchmarks/run_benchmarks.py --cases parse,orchestrator
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.catalog import make_catalog
+from src.agents import AssemblyAgent, ComparisonAgent, ContentBlockAgent, QuestionGeneratorAgent
+from src.graph import create_graph
+from src.instrumentation import percentile
+from src.orchestrator import create_orchestrator
+from src.tools import (
+    parse_product_data,
+    generate_questions,
+    generate_benefits_block,
+    generate_usage_block,
+    generate_safety_block,
+    generate_ingredients_block,
+    generate_comparison_block
+)
+
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+# ============================================================================
+# CASES
+# Each case maps a raw catalog to (fn, list of per-item arguments); only the
+# fn(arg) calls are timed.
+# ============================================================================
+
+def _parsed(catalog):
+    return [parse_product_data.invoke({"raw": raw}) for raw in catalog]
+
+
+def _tool_case(tool):
+    def setup(catalog):
+        return (lambda model: tool.invoke({"model": model})), _parsed(catalog)
+    return setup
+
+
+def _parse_case(catalog):
+    return (lambda raw: parse_product_data.invoke({"raw": raw})), catalog
+
+
+def _comparison_case(catalog):
+    product_b = ComparisonAgent().create_fictional_product()
+    return (
+        lambda model: generate_comparison_block.invoke({"model_a": model, "model_b": product_b})
+    ), _parsed(catalog)
+
+
+def _assembly_case(catalog):
+    agent = AssemblyAgent()
+    questions = QuestionGeneratorAgent()
+    blocks = ContentBlockAgent()
+    comparison = ComparisonAgent()
+    inputs = [
+        dict(
+            product_model=model,
+            questions=questions.invoke(model),
+            content_blocks=blocks.invoke(model),
+            comparison_data=comparison.invoke(model)
+        )
+        for model in _parsed(catalog)
+    ]
+    return (lambda kwargs: agent.invoke(**kwargs)), inputs
+
+
+def _orchestrator_case(catalog):
+    orchestrator = create_orchestrator()
+    return orchestrator.run, catalog
+
+
+def _orchestrator_direct_case(catalog):
+    orchestrator = create_orchestrator(direct=True)
+    return orchestrator.run, catalog
+
+
+def _graph_case(catalog):
+    graph = create_graph()
+    return (lambda raw: graph.invoke({"raw_input": raw})), catalog
+
+
+CASES: Dict[str, Callable[[List[Dict[str, Any]]], Tuple[Callable, List[Any]]]] = {
+    "parse": _parse_case,
+    "questions": _tool_case(generate_questions),
+    "block.benefits": _tool_case(generate_benefits_block),
+    "block.usage": _tool_case(generate_usage_block),
+    "block.safety": _tool_case(generate_safety_block),
+    "block.ingredients": _tool_case(generate_ingredients_block),
+    "block.comparison": _comparison_case,
+    "assembly": _assembly_case,
+    "orchestrator": _orchestrator_case,
+    "orchestrator.direct": _orchestrator_direct_case,
+    "graph": _graph_case,
+}
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run_case(name: str, catalog: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Time one case over a catalog; returns throughput and latency stats."""
+    fn, items = CASES[name](catalog)
+    fn(items[0])  # warm-up
+
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t0)
+    total = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "items": len(items),
+        "total_s": total,
+        "throughput_per_s": len(items) / total if total else 0.0,
+        "mean_us": total / len(items) * 1e6,
+        "p50_us": percentile(latencies, 0.5) * 1e6,
+        "p95_us": percentile(latencies, 0.95) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print throughput change per case; returns the number of regressions."""
+    regressions = 0
+    print(f"\n{'case':<32}{'baseline/s':>14}{'current/s':>14}{'change':>10}")
+    for key, result in current["results"].items():
+        before = baseline.get("results", {}).get(key)
+        if before is None:
+            continue
+        old, new = before["throughput_per_s"], result["throughput_per_s"]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{key:<32}{old:>14.1f}{new:>14.1f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1,1000',
+                        help="Comma-separated catalog sizes (e.g. 1,1000,100000)")
+    parser.add_argument('--cases', default=','.join(CASES),
+                        help=f"Comma-separated cases: {','.join(CASES)}")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=os.path.join(RESULTS_PATH, 'latest.json'),
+                        help="Where to save results")
+    parser.add_argument('--compare', help="Previous results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Throughput drop (fraction) reported as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    cases = args.cases.split(',')
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    report = {
+        "created": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": {},
+    }
+
+    print(f"{'case':<32}{'items/s':>12}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}")
+    for size in sizes:
+        catalog = make_catalog(size, args.seed)
+        for name in cases:
+            key = f"{name}[{size}]"
+            result = run_case(name, catalog)
+            report["results"][key] = result
+            print(f"{key:<32}{result['throughput_per_s']:>12.1f}"
+                  f"{result['p50_us']:>10.1f}{result['p95_us']:>10.1f}{result['p99_us']:>10.1f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,403 @@
+"""
+LangChain Agents Module
+Real agent components with clear responsibilities using LangChain's agent framework.
+"""
+import asyncio
+from typing import List, Dict, Any, Optional
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.runnables import RunnablePassthrough, RunnableLambda
+from langchain_core.language_models.fake import FakeListLLM
+from langchain_core.output_parsers import JsonOutputParser
 
+from src.tools import (
+    build_questions,
+    call_tool,
+    parse_product_data,
+    generate_questions,
+    generate_benefits_block,
+    generate_usage_block,
+    generate_safety_block,
+    generate_ingredients_block,
+    generate_comparison_block
+)
+from src.models import CompactQuestion, InternalProductModel, QuestionInput
+from src.template_engine import get_template_assembler
+
+# ============================================================================
+# AGENT 1: PARSER AGENT
+# ============================================================================
+
+class ParserAgent:
+    """
+    Agent responsible for parsing and normalizing raw product data.
+    Uses the parse_product_data tool to transform input into internal model.
+    """
+    
+    def __init__(self, direct: bool = False):
+        self.name = "ParserAgent"
+        self.direct = direct
+        self.tools = [parse_product_data]
+        self.description = "Parses raw product JSON into normalized internal model"
+    
+    def invoke(self, raw_input: Dict[str, Any]) -> InternalProductModel:
+        """Execute the parsing tool and return normalized model."""
+        result = call_tool(parse_product_data, {"raw": raw_input}, self.direct)
+        return result
+    
+    async def ainvoke(self, raw_input: Dict[str, Any]) -> InternalProductModel:
+        """Async variant of invoke(); direct calls run in a worker thread."""
+        if self.direct:
+            return await asyncio.to_thread(self.invoke, raw_input)
+        return await parse_product_data.ainvoke({"raw": raw_input})
+
+
+# ============================================================================
+# AGENT 2: QUESTION GENERATION AGENT
+# ============================================================================
+
+class QuestionGeneratorAgent:
+    """
+    Agent responsible for generating categorized user questions.
+    Uses rule-based templates to create 15+ questions across categories.
+    In trusted mode questions are slotted CompactQuestions, built without
+    pydantic validation.
+    """
+    
+    def __init__(self, direct: bool = False, trusted: bool = False):
+        self.name = "QuestionGeneratorAgent"
+        self.direct = direct or trusted
+        self.trusted = trusted
+        self.tools = [generate_questions]
+        self.description = "Generates categorized FAQ questions from product data"
+    
+    def invoke(self, product_model: InternalProductModel) -> List[QuestionInput]:
+        """Execute question generation tool."""
+        if self.trusted:
+            return build_questions(product_model, CompactQuestion)
+        result = call_tool(generate_questions, {"model": product_model}, self.direct)
+        return result
+    
+    async def ainvoke(self, product_model: InternalProductModel) -> List[QuestionInput]:
+        """Async variant of invoke(); direct calls run in a worker thread."""
+        if self.direct:
+            return await asyncio.to_thread(self.invoke, product_model)
+        return await generate_questions.ainvoke({"model": product_model})
+
+
+# ============================================================================
+# AGENT 3: CONTENT BLOCK AGENT
+# ============================================================================
+
+class ContentBlockAgent:
+    """
+    Agent responsible for generating reusable content blocks.
+    Orchestrates multiple block-generation tools to create structured content.
+    """
+    
+    def __init__(self, direct: bool = False):
+        self.name = "ContentBlockAgent"
+        self.direct = direct
+        self.tools = [
+            generate_benefits_block,
+            generate_usage_block,
+            generate_safety_block,
+            generate_ingredients_block
+        ]
+        self.description = "Generates reusable content blocks (benefits, usage, safety, ingredients)"
+    
+    def invoke_blocks(self, product_model: InternalProductModel, names: List[str]) -> Dict[str, Any]:
+        """Execute only the named content block tools (e.g. ["benefits"])."""
+        tools = {
+            "benefits": generate_benefits_block,
+            "usage": generate_usage_block,
+            "safety": generate_safety_block,
+            "ingredients": generate_ingredients_block
+        }
+        return {name: call_tool(tools[name], {"model": product_model}, self.direct) for name in names}
+    
+    def invoke(self, product_model: InternalProductModel) -> Dict[str, Any]:
+        """Execute all content block tools and aggregate results."""
+        return {
+            "benefits": call_tool(generate_benefits_block, {"model": product_model}, self.direct),
+            "usage": call_tool(generate_usage_block, {"model": product_model}, self.direct),
+            "safety": call_tool(generate_safety_block, {"model": product_model}, self.direct),
+            "ingredients": call_tool(generate_ingredients_block, {"model": product_model}, self.direct)
+        }
+    
+    async def ainvoke(self, product_model: InternalProductModel) -> Dict[str, Any]:
+        """
+        Async variant of invoke(); the block tools run concurrently. Direct
+        calls run in a worker thread.
+        """
+        if self.direct:
+            return await asyncio.to_thread(self.invoke, product_model)
+        args = {"model": product_model}
+        benefits, usage, safety, ingredients = await asyncio.gather(
+            generate_benefits_block.ainvoke(args),
+            generate_usage_block.ainvoke(args),
+            generate_safety_block.ainvoke(args),
+            generate_ingredients_block.ainvoke(args)
+        )
+        return {
+            "benefits": benefits,
+            "usage": usage,
+            "safety": safety,
+            "ingredients": ingredients
+        }
+
+
+# ============================================================================
+# AGENT 4: COMPARISON AGENT
+# ============================================================================
+
+class ComparisonAgent:
+    """
+    Agent responsible for comparing two products.
+    Compares with the most similar product of the catalog when a
+    ComparisonEngine is attached, otherwise with a fictional Product B.
+    """
+    
+    def __init__(self, direct: bool = False, engine=None):
+        self.name = "ComparisonAgent"
+        self.direct = direct
+        self.engine = engine
+        self.tools = [generate_comparison_block]
+        self.description = "Compares Product A with its closest competitor"
+    
+    def create_fictional_product(self) -> Dict[str, Any]:
+        """Generate a fictional competitor product for comparison."""
+        return {
+            "product_name": "RadiantGlow Vitamin C Concentrate",
+            "concentration": "15% Vitamin C",
+            "key_ingredients": ["Vitamin C", "Niacinamide", "Ferulic Acid"],
+            "benefits": "Brightening, Anti-aging, Pore minimizing",
+            "price": 899.0,
+            "currency": "INR"
+        }
+    
+    def select_competitor(self, product_model: InternalProductModel) -> Dict[str, Any]:
+        """Closest catalog product, falling back to the fictional one."""
+        if self.engine is not None:
+            nearest = self.engine.nearest(product_model, k=1)
+            if nearest:
+                return nearest[0]
+        return self.create_fictional_product()
+    
+    def invoke(self, product_model: InternalProductModel) -> Dict[str, Any]:
+        """Execute comparison tool against the selected competitor."""
+        product_b = self.select_competitor(product_model)
+        comparison = call_tool(generate_comparison_block, {
+            "model_a": product_model,
+            "model_b": product_b
+        }, self.direct)
+        return {
+            "product_b": product_b,
+            "comparison": comparison
+        }
+    
+    async def ainvoke(self, product_model: InternalProductModel) -> Dict[str, Any]:
+        """Async variant of invoke(); direct calls run in a worker thread."""
+        if self.direct:
+            return await asyncio.to_thread(self.invoke, product_model)
+        product_b = self.select_competitor(product_model)
+        comparison = await generate_comparison_block.ainvoke({
+            "model_a": product_model,
+            "model_b": product_b
+        })
+        return {
+            "product_b": product_b,
+            "comparison": comparison
+        }
+
+
+# ============================================================================
+# AGENT 5: ASSEMBLY AGENT
+# ============================================================================
+
+class AssemblyAgent:
+    """
+    Agent responsible for assembling final JSON pages.
+    Combines outputs from other agents into structured page objects, or,
+    when template_driven, into dictionaries shaped by src/templates.
+    In trusted mode pages are plain dictionaries equal to the page models'
+    model_dump(): their contents come from the already-validated product
+    model, so no page model is built or re-validated.
+    """
+    
+    def __init__(self, template_driven: bool = False, trusted: bool = False):
+        self.name = "AssemblyAgent"
+        self.tools = []  # Uses composition, not tools
+        self.description = "Assembles final JSON pages from agent outputs"
+        self.trusted = trusted
+        # Templates are loaded and compiled once per process
+        self.templates = get_template_assembler() if template_driven else None
+    
+    def invoke(
+        self,
+        product_model: InternalProductModel,
+        questions: List[QuestionInput],
+        content_blocks: Dict[str, Any],
+        comparison_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble all three output pages."""
+        if self.templates is not None:
+            return self.templates.assemble(
+                product_model, questions, content_blocks, comparison_data
+            )
+        
+        if self.trusted:
+            return self._assemble_dicts(product_model, questions, content_blocks, comparison_data)
+        
+        from src.models import ProductPage, FAQPage, ComparisonPage, Benefits, Usage, Safety, Ingredient
+        
+        # Build ingredients list
+        ingredients_list = [
+            Ingredient(ingredient=ing["name"], role=ing["role"])
+            for ing in content_blocks["ingredients"]
+        ]
+        
+        # Assemble Product Page
+        product_page = ProductPage(
+            name=product_model.product_name,
+            price=product_model.price,
+            currency=product_model.currency,
+            concentration=product_model.concentration,
+            ingredients=ingredients_list,
+            benefits=Benefits(
+                summary=content_blocks["benefits"]["summary"],
+                bullets=content_blocks["benefits"]["bullets"]
+            ),
+            usage=Usage(
+                how_to_use=content_blocks["usage"]["instructions"],
+                dosage=content_blocks["usage"]["dosage"],
+                timing=content_blocks["usage"]["timing"]
+            ),
+            safety=Safety(
+                side_effects=content_blocks["safety"]["side_effects"],
+                warnings=content_blocks["safety"]["warnings"]
+            ),
+            questions=questions[:5]
+        )
+        
+        # Assemble FAQ Page
+        faq_page = FAQPage(
+            title=f"FAQ - {product_model.product_name}",
+            questions=questions
+        )
+        
+        # Assemble Comparison Page
+        comparison_page = ComparisonPage(
+            title="Product Comparison",
+            product_a={
+                "name": product_model.product_name,
+                "concentration": product_model.concentration,
+                "ingredients": product_model.key_ingredients,
+                "benefits": product_model.benefits,
+                "price": product_model.price,
+                "currency": product_model.currency
+            },
+            product_b=comparison_data["product_b"],
+            comparison=comparison_data["comparison"]
+        )
+        
+        return {
+            "product_page": product_page,
+            "faq_page": faq_page,
+            "comparison_page": comparison_page
+        }
+    
+    def _assemble_dicts(
+        self,
+        product_model: InternalProductModel,
+        questions: List[Any],
+        content_blocks: Dict[str, Any],
+        comparison_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Trusted path: the page models' model_dump() shapes, built directly."""
+        question_dicts = [q.model_dump() for q in questions]
+        benefits, usage, safety = (content_blocks[k] for k in ("benefits", "usage", "safety"))
+        return {
+            "product_page": {
+                "name": product_model.product_name,
+                "price": product_model.price,
+                "currency": product_model.currency,
+                "concentration": product_model.concentration,
+                "ingredients": [
+                    {"ingredient": ing["name"], "role": ing["role"]}
+                    for ing in content_blocks["ingredients"]
+                ],
+                "benefits": {"summary": benefits["summary"], "bullets": benefits["bullets"]},
+                "usage": {
+                    "how_to_use": usage["instructions"],
+                    "dosage": usage["dosage"],
+                    "timing": usage["timing"]
+                },
+                "safety": {"side_effects": safety["side_effects"], "warnings": safety["warnings"]},
+                "questions": question_dicts[:5]
+            },
+            "faq_page": {
+                "title": f"FAQ - {product_model.product_name}",
+                "questions": question_dicts
+            },
+            "comparison_page": {
+                "title": "Product Comparison",
+                "product_a": {
+                    "name": product_model.product_name,
+                    "concentration": product_model.concentration,
+                    "ingredients": product_model.key_ingredients,
+                    "benefits": product_model.benefits,
+                    "price": product_model.price,
+                    "currency": product_model.currency
+                },
+                "product_b": comparison_data["product_b"],
+                "comparison": comparison_data["comparison"]
+            }
+        }
+    
+    async def ainvoke(
+        self,
+        product_model: InternalProductModel,
+        questions: List[QuestionInput],
+        content_blocks: Dict[str, Any],
+        comparison_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of invoke().
+        Assembly is pure in-memory model construction with no I/O, so it runs
+        inline rather than paying for a thread hop.
+        """
+        return self.invoke(
+            product_model=product_model,
+            questions=questions,
+            content_blocks=content_blocks,
+            comparison_data=comparison_data
+        )
+
+
+# ============================================================================
+# AGENT REGISTRY
+# ============================================================================
+
+def get_all_agents(
+    direct: bool = False,
+    template_driven: bool = False,
+    comparison_engine=None,
+    trusted: bool = False
+) -> Dict[str, Any]:
+    """
+    Returns all available agents for the orchestrator.
+    With direct=True the agents call the pure functions behind their tools;
+    with template_driven=True pages are assembled from the JSON templates;
+    a comparison_engine compares each product with its closest catalog peer.
+    trusted=True (implies direct) validates only the parsed input model;
+    questions are CompactQuestions and pages plain dictionaries.
+    """
+    direct = direct or trusted
+    return {
+        "parser": ParserAgent(direct=direct),
+        "question_generator": QuestionGeneratorAgent(direct=direct, trusted=trusted),
+        "content_blocks": ContentBlockAgent(direct=direct),
+        "comparison": ComparisonAgent(direct=direct, engine=comparison_engine),
+        "assembly": AssemblyAgent(template_driven=template_driven, trusted=trusted)
+    }
@@ -8,32 +8,36 @@ class AssemblerAgent:
         self.template_agent = template_agent
         self.templates = templates
         self.output_path = output_path
+        # Private copy of the comparison template ('with' is set per run), reused across
+        # runs so its compiled plan is too
+        self._comparison_template = json.loads(json.dumps(templates['comparison']))
 
     def run(self, model: Dict[str, Any], questions: List[Dict[str, Any]]):
         outputs = {}
 
         # FAQ
-        faq_json = self.template_agent.render(self.templates['faq'], model, questions=questions[:10])
+        faq_json = self.template_agent.render(self.templates['faq'], model, questions=questions[:10],
+                                              name='faq')
         outputs['faq'] = faq_json
         with open(f'{self.output_path}/faq.json', 'w', encoding='utf8') as f:
             json.dump(faq_json, f, indent=2, ensure_ascii=False)
 
         # Product page
-        product_json = self.template_agent.render(self.templates['product_page'], model, questions=questions)
+        product_json = self.template_agent.render(self.templates['product_page'], model, questions=questions,
+                                                  name='product_page')
         outputs['product_page'] = product_json
         with open(f'{self.output_path}/product_page.json', 'w', encoding='utf8') as f:
             json.dump(product_json, f, indent=2, ensure_ascii=False)
 
         # Comparison: create a fictional product B
         product_b = self._make_fictional_product_b(model)
-        comparison_template = self.templates['comparison']
-        comparison_template = json.loads(json.dumps(comparison_template))
+        comparison_template = self._comparison_template
         if 'compare' in comparison_template:
             comp_spec = comparison_template['compare']
             if isinstance(comp_spec, dict) and comp_spec.get('block') == 'compare_ingredients_block':
                 comp_spec['with'] = product_b
 
-        comparison_json = self.template_agent.render(comparison_template, model)
+        comparison_json = self.template_agent.render(comparison_template, model, name='comparison')
         comparison_json['product_b'] = product_b
         outputs['comparison'] = comparison_json
         with open(f'{self.output_path}/comparison_page.json', 'w', encoding='utf8') as f:
@@ -51,5 +55,6 @@ class AssemblerAgent:
             'benefits': 'Brightening, Hydration',
             'how_to_use': 'Apply at night',
             'side_effects': 'None commonly reported',
-            'price': 899.0
+            'price': 899.0,
+            'currency': 'INR'
         }
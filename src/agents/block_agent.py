@@ -1,6 +1,8 @@
 
 from typing import Dict, Any, List
 
+from src.ingredients import get_ingredient_index, get_ingredient_normalizer
+
 
 class BlockAgent:
    
@@ -25,11 +27,13 @@ class BlockAgent:
         }
 
     def ingredients_block(self, model: Dict[str, Any]) -> List[Dict[str, str]]:
-        return [{'ingredient': i, 'role': 'active' if i.lower().strip() in ['vitamin c', 'hyaluronic acid'] else 'support'} for i in model.get('key_ingredients', [])]
+        index = get_ingredient_index()
+        return [{'ingredient': i, 'role': index.role(i).lower()} for i in model.get('key_ingredients', [])]
 
     def compare_ingredients_block(self, model_a: Dict[str, Any], model_b: Dict[str, Any]) -> Dict[str, Any]:
-        a_ings = set([i.lower() for i in model_a.get('key_ingredients', [])])
-        b_ings = set([i.lower() for i in model_b.get('key_ingredients', [])])
+        canonical = get_ingredient_normalizer().canonical
+        a_ings = set([canonical(i).lower() for i in model_a.get('key_ingredients', [])])
+        b_ings = set([canonical(i).lower() for i in model_b.get('key_ingredients', [])])
         common = list(a_ings & b_ings)
         only_a = list(a_ings - b_ings)
         only_b = list(b_ings - a_ings)
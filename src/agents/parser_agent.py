@@ -1,6 +1,9 @@
 
 from typing import Dict, Any
 
+from src.ingredients import get_ingredient_normalizer
+from src.pricing import DEFAULT_CURRENCY, parse_price
+
 
 class ParserAgent:
 
@@ -19,18 +22,13 @@ class ParserAgent:
 
  
         if isinstance(model.get('key_ingredients'), str):
-            model['key_ingredients'] = [i.strip() for i in model['key_ingredients'].split(',')]
+            model['key_ingredients'] = get_ingredient_normalizer().canonicalize(model['key_ingredients'].split(','))
 
         if isinstance(model.get('skin_type'), str):
             model['skin_type'] = [s.strip() for s in model['skin_type'].split(',')]
 
-        # Price numeric
-        p = model.get('price')
-        try:
-            if isinstance(p, str) and p.startswith('₹'):
-                p = p.replace('₹', '').strip()
-            model['price'] = float(p)
-        except Exception:
-            model['price'] = None
+        # Price numeric, with its currency
+        price = parse_price(model.get('price'), model.get('currency') or DEFAULT_CURRENCY)
+        model['price'], model['currency'] = price if price else (None, None)
 
         return model
@@ -1,49 +1,81 @@
 
 import json
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional
+
+MODEL_REF = re.compile(r'\{\{model\.([a-z_]+)\}\}')
+
+
+class CompiledTemplate:
+    """Render plan for one template: one callable per top-level field."""
+
+    def __init__(self, fields: List[tuple]):
+        self.fields = fields
+
+    def render(self, model: Dict[str, Any], questions=None) -> Dict[str, Any]:
+        return {field: fn(model, questions) for field, fn in self.fields}
 
 
 class TemplateAgent:
-    
+    """
+    Renders templates through compiled render plans. Plans are cached by
+    template name, one per name: passing a different template object under
+    the same name recompiles it. Unnamed templates are compiled per render.
+    """
 
     def __init__(self, block_interface):
         self.block = block_interface
+        self._compiled: Dict[str, tuple] = {}
 
-    def render(self, template_def: Dict[str, Any], model: Dict[str, Any], questions=None) -> Dict[str, Any]:
-        out = {}
-        for field, spec in template_def.items():
-            out[field] = self._process_value(spec, model, questions)
-        return out
+    def render(self, template_def: Dict[str, Any], model: Dict[str, Any], questions=None,
+               name: Optional[str] = None) -> Dict[str, Any]:
+        if name is None:
+            return self.compile(template_def).render(model, questions)
+        # A named template must not be mutated after its first render, except for 'with'
+        entry = self._compiled.get(name)
+        if entry is None or entry[0] is not template_def:
+            entry = self._compiled[name] = (template_def, self.compile(template_def))
+        return entry[1].render(model, questions)
 
-    def _process_value(self, spec: Any, model: Dict[str, Any], questions=None) -> Any:
-      
+    def compile(self, template_def: Dict[str, Any]) -> CompiledTemplate:
+        return CompiledTemplate([(field, self._compile_value(spec)) for field, spec in template_def.items()])
+
+    def _compile_value(self, spec: Any) -> Callable[[Dict[str, Any], Any], Any]:
         if isinstance(spec, str):
-           
             if '{{' in spec and '}}' in spec:
-                result = spec
-                pattern = r'\{\{model\.([a-z_]+)\}\}'
-                for match in re.finditer(pattern, spec):
-                    key = match.group(1)
-                    value = model.get(key)
-                    result = result.replace(match.group(0), str(value) if value is not None else '')
-                return result
-     
-            elif spec == 'questions' and questions is not None:
-                return questions
+                return self._compile_string(spec)
+            elif spec == 'questions':
+                return lambda model, questions: questions if questions is not None else spec
             else:
-                return spec
+                return lambda model, questions: spec
         elif isinstance(spec, dict):
             if spec.get('block'):
-
                 block_name = spec['block']
                 fn = getattr(self.block, block_name)
                 if block_name == 'compare_ingredients_block':
-                    return fn(model, spec.get('with'))
+                    # 'with' is read per render so callers can swap the product being compared
+                    return lambda model, questions: fn(model, spec.get('with'))
                 else:
-                    return fn(model)
+                    return lambda model, questions: fn(model)
             else:
-              
-                return {k: self._process_value(v, model, questions) for k, v in spec.items()}
+                children = [(k, self._compile_value(v)) for k, v in spec.items()]
+                return lambda model, questions: {k: child(model, questions) for k, child in children}
         else:
-            return spec
+            return lambda model, questions: spec
+
+    @staticmethod
+    def _compile_string(spec: str) -> Callable[[Dict[str, Any], Any], str]:
+        # Split once into literal text and model keys; rendering is then a plain join
+        literals = MODEL_REF.split(spec)
+        if len(literals) == 1:
+            return lambda model, questions: spec
+        texts, keys = literals[0::2], literals[1::2]
+
+        def render(model, questions):
+            out = [texts[0]]
+            for key, text in zip(keys, texts[1:]):
+                value = model.get(key)
+                out.append(str(value) if value is not None else '')
+                out.append(text)
+            return ''.join(out)
+        return render
@@ -0,0 +1,130 @@
+"""
+Columnar Batch Parser
+Normalizes whole chunks of raw product records column by column, producing
+the same InternalProductModels as parse_product_data with per-schema and
+per-column work done once instead of once per record.
+"""
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from src.ingredients import get_ingredient_normalizer
+from src.models import InternalProductModel
+from src.pricing import DEFAULT_CURRENCY, parse_price
+
+FIELDS = tuple(InternalProductModel.model_fields)
+
+# Comma-separated list columns
+LIST_FIELDS = ("key_ingredients", "skin_type")
+
+Columns = Dict[str, List[Any]]
+
+# Validates a whole list of records in a single call into pydantic-core
+_MODEL_LIST = TypeAdapter(List[InternalProductModel])
+
+
+@lru_cache(maxsize=256)
+def key_mapping(keys: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """(raw key, model field) pairs for one record schema, computed once per schema."""
+    return tuple(
+        (key, field) for key in keys
+        for field in (key.lower().replace(' ', '_'),) if field in FIELDS
+    )
+
+
+def parse_price_column(
+    values: List[Any],
+    currencies: List[Optional[str]]
+) -> Tuple[List[Optional[float]], List[Optional[str]]]:
+    """
+    Parse a price column into amount and currency columns. ``currencies``
+    holds each record's own currency field, used for prices without a symbol.
+    """
+    amounts, codes = [], []
+    for value, currency in zip(values, currencies):
+        price = parse_price(value, currency or DEFAULT_CURRENCY)
+        amounts.append(price.amount if price else None)
+        codes.append(price.currency if price else None)
+    return amounts, codes
+
+
+def _split_column(values: List[Any], canonicalize=None) -> List[Any]:
+    """
+    Split comma-separated strings; missing values become empty lists.
+    Each distinct string is split once per column (skin types and common
+    ingredient lists repeat heavily across a catalog).
+    """
+    split: Dict[str, List[str]] = {}
+    out = []
+    append = out.append
+    for value in values:
+        if value.__class__ is str:
+            parts = split.get(value)
+            if parts is None:
+                parts = value.split(',')
+                parts = split[value] = canonicalize(parts) if canonicalize else [p.strip() for p in parts]
+            append(parts)
+        else:
+            append([] if value is None else value)
+    return out
+
+
+def parse_columns(records: List[Dict[str, Any]]) -> Columns:
+    """
+    Normalize a chunk of raw records into one list per model field.
+    Records sharing a schema (the usual case) are gathered with one
+    itemgetter per field; unknown keys are dropped.
+    """
+    size = len(records)
+    groups = defaultdict(list)
+    for position, raw in enumerate(records):
+        groups[tuple(raw)].append(position)
+
+    columns: Columns = {}
+    for schema, positions in groups.items():
+        for key, field in key_mapping(schema):
+            getter = itemgetter(key)
+            if len(positions) == size:
+                columns[field] = [getter(raw) for raw in records]
+                continue
+            column = columns.setdefault(field, [None] * size)
+            for position in positions:
+                column[position] = getter(records[position])
+    for field in FIELDS:
+        columns.setdefault(field, [None] * size)
+
+    columns["key_ingredients"] = _split_column(
+        columns["key_ingredients"], get_ingredient_normalizer().canonicalize
+    )
+    columns["skin_type"] = _split_column(columns["skin_type"])
+    columns["price"], columns["currency"] = parse_price_column(columns["price"], columns["currency"])
+    return columns
+
+
+def columns_to_models(columns: Columns) -> List[InternalProductModel]:
+    """Validate column-wise data into one InternalProductModel per record."""
+    return _MODEL_LIST.validate_python([
+        dict(zip(FIELDS, row)) for row in zip(*(columns[field] for field in FIELDS))
+    ])
+
+
+def parse_batch(records: Iterable[Dict[str, Any]]) -> List[InternalProductModel]:
+    """Parse a chunk of raw records into InternalProductModels."""
+    return columns_to_models(parse_columns(list(records)))
+
+
+def iter_parsed(
+    raw_inputs: Iterable[Dict[str, Any]],
+    chunk_size: int = 4096
+) -> Iterator[InternalProductModel]:
+    """Stream InternalProductModels from raw records, parsed a chunk at a time."""
+    iterator = iter(raw_inputs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield from columns_to_models(parse_columns(chunk))
@@ -0,0 +1,121 @@
+"""
+Content-Addressed Page Cache
+Persists generated pages keyed by a stable hash of the normalized product.
+"""
+import glob
+import hashlib
+import os
+import sqlite3
+from typing import Dict, Any, Optional
+
+from src.ingredients import DEFAULT_INDEX_PATH, INDEX_PATH_ENV
+from src.models import InternalProductModel, ProductPage, FAQPage, ComparisonPage
+from src.questions import BANK_PATH_ENV, DEFAULT_BANK_PATH
+
+# Bump to invalidate every cached entry without a code or data change
+PIPELINE_VERSION = "1"
+
+SOURCE_PATH = os.path.dirname(__file__)
+TEMPLATES_PATH = os.path.join(SOURCE_PATH, 'templates')
+
+PAGE_MODELS = {
+    "product_page": ProductPage,
+    "faq_page": FAQPage,
+    "comparison_page": ComparisonPage,
+}
+
+
+def pipeline_version() -> str:
+    """
+    Version string covering the pipeline source (every module of the src
+    package), the page templates, the ingredient dictionary and the question
+    bank. Editing any of them invalidates every cached entry.
+    """
+    digest = hashlib.sha256(PIPELINE_VERSION.encode('utf-8'))
+    data_files = sorted(
+        glob.glob(os.path.join(SOURCE_PATH, '*.py')) + glob.glob(os.path.join(SOURCE_PATH, '*', '*.py'))
+    )
+    data_files += sorted(glob.glob(os.path.join(TEMPLATES_PATH, '*.json')))
+    data_files.append(os.environ.get(INDEX_PATH_ENV) or DEFAULT_INDEX_PATH)
+    data_files.append(os.environ.get(BANK_PATH_ENV) or DEFAULT_BANK_PATH)
+    for path in data_files:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class PageCache:
+    """
+    On-disk (SQLite) cache of generated page sets.
+
+    Keys are content addresses: a hash of the pipeline version and the
+    ``InternalProductModel`` produced by the parser, so any product whose
+    normalized input is unchanged between runs is served from the cache.
+    """
+
+    def __init__(self, path: str, version: Optional[str] = None, commit_every: int = 1000):
+        self.path = path
+        self.version = version or pipeline_version()
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self._pending_writes = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, product_page TEXT, faq_page TEXT, comparison_page TEXT)"
+        )
+
+    def key_for(self, product_model: InternalProductModel) -> str:
+        """Stable content address for a normalized product."""
+        payload = self.version + product_model.model_dump_json()
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached page set for `key`, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT product_page, faq_page, comparison_page FROM pages WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {
+            name: model.model_validate_json(data)
+            for (name, model), data in zip(PAGE_MODELS.items(), row)
+        }
+
+    def put(self, key: str, outputs: Dict[str, Any]):
+        """Store a generated page set, committing in batches."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+            (key, *(outputs[name].model_dump_json() for name in PAGE_MODELS))
+        )
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        """Flush pending writes to disk."""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self):
+        """Commit pending writes and close the database."""
+        self.commit()
+        self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this session."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def __enter__(self) -> "PageCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
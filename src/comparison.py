@@ -0,0 +1,137 @@
+"""
+Catalog Comparison Engine
+Finds each product's most similar real competitors in a catalog through an
+inverted ingredient index, instead of scanning every pair of products.
+"""
+import heapq
+import sys
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional
+
+from src.batch_parser import iter_parsed
+from src.ingredients import get_ingredient_normalizer
+from src.models import InternalProductModel
+from src.pricing import same_currency
+
+# Fields of a competitor, in the shape ComparisonAgent uses for product B
+COMPETITOR_FIELDS = ("product_name", "concentration", "key_ingredients", "benefits", "price", "currency")
+
+
+def _ingredient_set(ingredients: Iterable[str]) -> frozenset:
+    canonical = get_ingredient_normalizer().canonical
+    return frozenset(canonical(i).lower() for i in ingredients)
+
+
+def _price_distance(
+    a: Optional[float],
+    b: Optional[float],
+    currency_a: Optional[str] = None,
+    currency_b: Optional[str] = None
+) -> float:
+    """Relative price gap in [0, 1]; 1 when either price is unknown or in another currency."""
+    if not a or not b or not same_currency(currency_a, currency_b):
+        return 1.0
+    return abs(a - b) / max(a, b)
+
+
+class ComparisonEngine:
+    """
+    Nearest-competitor search over one catalog (batch).
+
+    The index is built once: canonical ingredient → ids of the products
+    containing it. A query gathers candidates from the posting lists of its
+    own ingredients, so it only visits products sharing at least one
+    ingredient, counts each candidate's shared ingredients against the full
+    ingredient set and ranks them by ingredient Jaccard similarity minus
+    ``price_weight`` times the relative price gap. Candidates are scored in
+    decreasing order of shared ingredients and scoring stops as soon as no
+    remaining candidate can beat the current top k.
+
+    Ingredients found in more than ``max_postings`` products (water,
+    glycerin, ...) carry little signal and would turn a query into a full
+    scan, so candidates are drawn from the query's rarer ingredients only;
+    common ingredients still count towards the similarity of every
+    candidate. When no other product shares a rare ingredient with the
+    query (or it has none), candidates are drawn from the first
+    ``max_postings`` products of each of its lists.
+    """
+
+    def __init__(
+        self,
+        products: Iterable[InternalProductModel],
+        price_weight: float = 0.25,
+        max_postings: int = 1000
+    ):
+        self.price_weight = price_weight
+        self.max_postings = max_postings
+        self._competitors: List[Dict[str, Any]] = []
+        self._ingredients: List[tuple] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for product_id, product in enumerate(products):
+            self._competitors.append({field: getattr(product, field) for field in COMPETITOR_FIELDS})
+            ingredients = tuple(map(sys.intern, _ingredient_set(product.key_ingredients)))
+            self._ingredients.append(ingredients)
+            for ingredient in ingredients:
+                self._postings[ingredient].append(product_id)
+        self._postings = dict(self._postings)
+
+    @classmethod
+    def from_raw(cls, raw_inputs: Iterable[Dict[str, Any]], **kwargs) -> "ComparisonEngine":
+        """Build the engine from raw product dictionaries."""
+        return cls(iter_parsed(raw_inputs), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._competitors)
+
+    def _candidates(self, postings: List[List[int]], product_name: str) -> set:
+        """Ids of the products in ``postings``, other than the query product itself."""
+        competitors = self._competitors
+        return {
+            product_id for product_id in set().union(*postings)
+            if competitors[product_id]["product_name"] != product_name
+        }
+
+    def _shared_counts(self, ingredients: frozenset, product_name: str) -> Dict[int, int]:
+        """Number of ingredients shared with the query, per candidate product."""
+        postings = [self._postings.get(ingredient, ()) for ingredient in ingredients]
+        candidates = self._candidates(
+            [ids for ids in postings if len(ids) <= self.max_postings], product_name
+        )
+        if not candidates:
+            # No other product has a rare ingredient of the query
+            candidates = self._candidates([ids[:self.max_postings] for ids in postings], product_name)
+        shared = ingredients.intersection
+        return {
+            product_id: len(shared(self._ingredients[product_id]))
+            for product_id in candidates
+        }
+
+    def nearest(self, product: InternalProductModel, k: int = 1) -> List[Dict[str, Any]]:
+        """
+        Up to ``k`` most similar catalog products, best first.
+        The product itself (same name) is never returned; products with no
+        ingredient in common are not considered.
+        """
+        ingredients = _ingredient_set(product.key_ingredients)
+        size = len(ingredients)
+        by_common = defaultdict(list)
+        for product_id, common in self._shared_counts(ingredients, product.product_name).items():
+            by_common[common].append(product_id)
+
+        top: List[tuple] = []  # min-heap of (score, -product_id)
+        for common in sorted(by_common, reverse=True):
+            # Jaccard is at most common / size and the price term only lowers it
+            if len(top) == k and common / size <= top[0][0]:
+                break
+            for product_id in by_common[common]:
+                competitor = self._competitors[product_id]
+                jaccard = common / (size + len(self._ingredients[product_id]) - common)
+                gap = _price_distance(product.price, competitor["price"],
+                                      product.currency, competitor["currency"])
+                score = jaccard - self.price_weight * gap
+                item = (score, -product_id)
+                if len(top) < k:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+        return [dict(self._competitors[-product_id]) for _, product_id in sorted(top, reverse=True)]
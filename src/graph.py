@@ -2,6 +2,7 @@
 LangGraph Definition
 Orchestration graph that coordinates the multi-agent workflow.
 """
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from src.state import AgentState
 from src.nodes import (
@@ -11,50 +12,72 @@ from src.nodes import (
     assembly_node
 )
 
-def create_graph():
+def create_graph(parallel: bool = True, profiler=None):
     """
     Creates and compiles the content generation workflow.
     
     Graph Structure:
-    ┌─────────────┐
-    │   START     │
-    └──────┬──────┘
-           │
-    ┌──────▼──────┐
-    │   Parser    │  → Normalize input data
-    └──────┬──────┘
-           │
-    ┌──────▼──────┐
-    │  Question   │  → Generate 15+ questions
-    │  Generator  │
-    └──────┬──────┘
-           │
-    ┌──────▼──────┐
-    │  Content    │  → Generate reusable blocks
-    │   Blocks    │
-    └──────┬──────┘
-           │
-    ┌──────▼──────┐
-    │  Assembler  │  → Build final pages
-    └──────┬──────┘
-           │
-    ┌──────▼──────┐
-    │    END      │
-    └─────────────┘
+              ┌─────────────┐
+              │   START     │
+              └──────┬──────┘
+                     │
+              ┌──────▼──────┐
+              │   Parser    │  → Normalize input data
+              └──────┬──────┘
+             ┌───────┴───────┐
+      ┌──────▼──────┐ ┌──────▼──────┐
+      │  Question   │ │  Content    │  → Both read only product_model,
+      │  Generator  │ │   Blocks    │    so they run in the same step
+      └──────┬──────┘ └──────┬──────┘
+             └───────┬───────┘
+              ┌──────▼──────┐
+              │  Assembler  │  → Build final pages (waits for both)
+              └──────┬──────┘
+              ┌──────▼──────┐
+              │    END      │
+              └─────────────┘
+    
+    Args:
+        parallel: Fan out from the parser into both generators (default).
+            Pass False to wire the original linear DAG.
+        profiler: Optional PipelineProfiler; every node call is measured
+            under the node's name.
     """
     workflow = StateGraph(AgentState)
     
+    nodes = {
+        "parser": parser_node,
+        "question_generator": question_generator_node,
+        "content_blocks": content_blocks_node,
+        "assembler": assembly_node,
+    }
+    
     # Add nodes with clear responsibilities
-    workflow.add_node("parser", parser_node)
-    workflow.add_node("question_generator", question_generator_node)
-    workflow.add_node("content_blocks", content_blocks_node)
-    workflow.add_node("assembler", assembly_node)
+    for name, node in nodes.items():
+        workflow.add_node(name, profiler.wrap(node, name) if profiler else node)
     
-    # Define edges (linear DAG)
     workflow.set_entry_point("parser")
-    workflow.add_edge("parser", "question_generator")
-    workflow.add_edge("question_generator", "content_blocks")
-    workflow.add_edge("content_blocks", "assembler")
+    if parallel:
+        # Fan out / join
+        workflow.add_edge("parser", "question_generator")
+        workflow.add_edge("parser", "content_blocks")
+        workflow.add_edge(["question_generator", "content_blocks"], "assembler")
+    else:
+        # Linear DAG
+        workflow.add_edge("parser", "question_generator")
+        workflow.add_edge("question_generator", "content_blocks")
+        workflow.add_edge("content_blocks", "assembler")
     workflow.add_edge("assembler", END)
     
     return workflow.compile()
+
+
+@lru_cache(maxsize=None)
+def get_graph(parallel: bool = True):
+    """
+    Returns the compiled workflow, compiling it once per process.
+    
+    Compiled graphs are stateless between invocations, so long-lived workers
+    should use this instead of calling create_graph() per request.
+    """
+    return create_graph(parallel)
@@ -0,0 +1,309 @@
+"""
+Ingredient Knowledge Index
+Normalized ingredient names and aliases mapped to role and benefit, built
+once into hashed lookups. Large dictionaries can be compiled into a
+memory-mapped file so that every process shares the OS page cache instead of
+holding its own copy. Aliases are also indexed by their words, so raw
+ingredient tokens map to canonical names without loading the dictionary.
+"""
+import json
+import mmap
+from abc import ABC, abstractmethod
+import os
+import re
+import struct
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(__file__), 'data', 'ingredients.json')
+
+# Set to a .json dictionary or a compiled .idx file to override the default
+INDEX_PATH_ENV = "INGREDIENT_INDEX_PATH"
+
+DEFAULT_ROLE = "Support"
+DEFAULT_BENEFIT = "Skin conditioning"
+
+
+class IngredientInfo(NamedTuple):
+    """Canonical ingredient record."""
+    name: str
+    role: str
+    benefit: str
+
+
+_WORD = re.compile(r'[0-9a-z]+')
+
+
+def normalize_name(name: str) -> str:
+    """Lookup key for an ingredient name: lower-case, single-spaced."""
+    return ' '.join(name.lower().split())
+
+
+def ingredient_words(text: str) -> List[str]:
+    """Alphanumeric words of a name; case, hyphens and punctuation are ignored."""
+    return _WORD.findall(text.lower())
+
+
+def alias_words_table(items: Iterable[tuple]) -> Dict[str, str]:
+    """
+    Words key (ingredient_words joined by spaces) → canonical name for every
+    name and alias; of keys sharing their words, the greatest wins.
+    """
+    table = {}
+    for key, info in sorted(items):
+        words = ' '.join(ingredient_words(key))
+        if words:
+            table[words] = info.name
+    return table
+
+
+class _IndexLookups(ABC):
+    """Convenience accessors shared by the index implementations."""
+
+    # Word count of the longest name or alias
+    max_alias_words: int
+
+    @abstractmethod
+    def lookup(self, name: str) -> Optional[IngredientInfo]:
+        """IngredientInfo for a name or alias, or None if unknown."""
+
+    @abstractmethod
+    def alias_name(self, words: str) -> Optional[str]:
+        """Canonical name for a name or alias given as its space-joined words."""
+
+    def role(self, name: str) -> str:
+        info = self.lookup(name)
+        return info.role if info else DEFAULT_ROLE
+
+    def benefit(self, name: str) -> str:
+        info = self.lookup(name)
+        return info.benefit if info else DEFAULT_BENEFIT
+
+
+# ============================================================================
+# IN-MEMORY INDEX
+# ============================================================================
+
+class IngredientIndex(_IndexLookups):
+    """Hash index from normalized names and aliases to IngredientInfo."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]]):
+        self._by_key: Dict[str, IngredientInfo] = {}
+        for entry in entries:
+            info = IngredientInfo(entry["name"], entry.get("role", DEFAULT_ROLE),
+                                  entry.get("benefit", DEFAULT_BENEFIT))
+            for key in [entry["name"], *entry.get("aliases", [])]:
+                self._by_key[normalize_name(key)] = info
+        self._by_words = alias_words_table(self._by_key.items())
+        self.max_alias_words = max((words.count(' ') + 1 for words in self._by_words), default=0)
+
+    @classmethod
+    def from_json(cls, path: str) -> "IngredientIndex":
+        """Load a JSON list of {name, aliases, role, benefit} entries."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def lookup(self, name: str) -> Optional[IngredientInfo]:
+        return self._by_key.get(normalize_name(name))
+
+    def alias_name(self, words: str) -> Optional[str]:
+        return self._by_words.get(words)
+
+    def items(self):
+        """(normalized key, IngredientInfo) pairs, aliases included."""
+        return self._by_key.items()
+
+    def save_mapped(self, path: str):
+        """Compile this index into a memory-mappable file (see MappedIngredientIndex)."""
+        write_mapped_index(self.items(), path)
+
+
+# ============================================================================
+# MEMORY-MAPPED INDEX
+#
+# File layout:
+#   records   one UTF-8 line per key, sorted by key: key \t name \t role \t benefit \n
+#             (fields may not contain tabs or newlines)
+#   aliases   one UTF-8 line per words key (see alias_words_table), sorted:
+#             words \t name \n
+#   offsets   uint64 start offset of every record, in key order
+#   alias offsets   uint64 start offset of every alias line, in words order
+#   footer    uint64 record count, uint64 offset of the offsets table,
+#             uint64 alias count, uint64 offset of the alias offsets table,
+#             uint64 longest alias in words, 8-byte format magic
+# ============================================================================
+
+_FOOTER = struct.Struct('<QQQQQ8s')
+_OFFSET = struct.Struct('<Q')
+_MAGIC = b'INGIDX02'
+
+
+def write_mapped_index(items: Iterable[tuple], path: str):
+    """
+    Write (normalized key, IngredientInfo) pairs as a mapped index file.
+    Raises ValueError if a field contains a tab or newline, which would
+    corrupt the record layout.
+    """
+    items = sorted(items)
+    offsets: List[int] = []
+    alias_offsets: List[int] = []
+    with open(path, 'wb') as f:
+        for key, info in items:
+            offsets.append(f.tell())
+            fields = (key, info.name, info.role, info.benefit)
+            for field in fields:
+                if '\t' in field or '\n' in field:
+                    raise ValueError(f"ingredient field {field!r} contains a tab or newline")
+            f.write('\t'.join(fields).encode('utf-8') + b'\n')
+        aliases = alias_words_table(items)
+        for words in sorted(aliases):
+            alias_offsets.append(f.tell())
+            f.write(f"{words}\t{aliases[words]}\n".encode('utf-8'))
+        table = f.tell()
+        for offset in offsets:
+            f.write(_OFFSET.pack(offset))
+        alias_table = f.tell()
+        for offset in alias_offsets:
+            f.write(_OFFSET.pack(offset))
+        longest = max((words.count(' ') + 1 for words in aliases), default=0)
+        f.write(_FOOTER.pack(len(offsets), table, len(alias_offsets), alias_table, longest, _MAGIC))
+
+
+class MappedIngredientIndex(_IndexLookups):
+    """
+    Read-only index backed by a memory-mapped file.
+    Opening is O(1) and lookups (by key or by alias words) binary-search the
+    sorted records in place, so dictionaries of any size cost no load time
+    or per-process memory.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        footer = _FOOTER.unpack_from(self._map, len(self._map) - _FOOTER.size) \
+            if len(self._map) >= _FOOTER.size else None
+        if footer is None or footer[-1] != _MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a current ingredient index; recompile it")
+        self._count, self._table, self._alias_count, self._alias_table, self.max_alias_words, _ = footer
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record_start(self, i: int, table: int) -> int:
+        return _OFFSET.unpack_from(self._map, table + i * _OFFSET.size)[0]
+
+    def _find(self, target: bytes, count: int, table: int) -> Optional[str]:
+        """The line whose first field is `target`, decoded, or None."""
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self._record_start(mid, table)
+            key = self._map[start:self._map.find(b'\t', start)]
+            if key < target:
+                lo = mid + 1
+            elif key > target:
+                hi = mid
+            else:
+                return self._map[start:self._map.find(b'\n', start)].decode('utf-8')
+        return None
+
+    def lookup(self, name: str) -> Optional[IngredientInfo]:
+        line = self._find(normalize_name(name).encode('utf-8'), self._count, self._table)
+        return IngredientInfo(*line.split('\t')[1:]) if line is not None else None
+
+    def alias_name(self, words: str) -> Optional[str]:
+        line = self._find(words.encode('utf-8'), self._alias_count, self._alias_table)
+        return line.split('\t', 1)[1] if line is not None else None
+
+    def items(self):
+        """(normalized key, IngredientInfo) pairs, in key order."""
+        for i in range(self._count):
+            start = self._record_start(i, self._table)
+            line = self._map[start:self._map.find(b'\n', start)].decode('utf-8')
+            key, *fields = line.split('\t')
+            yield key, IngredientInfo(*fields)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+# ============================================================================
+# NAME NORMALIZATION
+# ============================================================================
+
+class IngredientNormalizer:
+    """
+    Maps raw ingredient tokens ("Vit. C", "L-Ascorbic Acid 15%") to canonical
+    ingredient names.
+
+    A token resolves to the longest name or alias found at the earliest word
+    position, so case, punctuation and surrounding words ("pure", "15%") do
+    not matter. Candidate phrases are looked up through the index's alias
+    words table, which a mapped index searches in place. Resolved tokens are
+    memoized in a bounded LRU cache, making repeated tokens across a catalog
+    a single cache hit. Unknown tokens are kept, whitespace-trimmed.
+    """
+
+    def __init__(self, index, memo_size: int = 1 << 16):
+        self._index = index
+        self.canonical = lru_cache(maxsize=memo_size)(self._canonical)
+
+    def _match(self, words: List[str]) -> Optional[str]:
+        alias_name, longest = self._index.alias_name, self._index.max_alias_words
+        for start in range(len(words)):
+            for end in range(min(len(words), start + longest), start, -1):
+                name = alias_name(' '.join(words[start:end]))
+                if name is not None:
+                    return name
+        return None
+
+    def _canonical(self, token: str) -> str:
+        """Canonical name for one raw ingredient token."""
+        return self._match(ingredient_words(token)) or ' '.join(token.split())
+
+    def canonicalize(self, tokens: Iterable[str]) -> List[str]:
+        """Canonical names for raw tokens, de-duplicated in order; blanks are dropped."""
+        names = dict.fromkeys(map(self.canonical, tokens))
+        names.pop('', None)
+        return list(names)
+
+
+# ============================================================================
+# PROCESS-WIDE INDEX
+# ============================================================================
+
+def load_ingredient_index(path: str):
+    """Load a .json dictionary into memory, or map a compiled .idx file."""
+    if path.endswith('.json'):
+        return IngredientIndex.from_json(path)
+    return MappedIngredientIndex(path)
+
+
+@lru_cache(maxsize=None)
+def get_ingredient_index():
+    """Shared ingredient index, built on first use only."""
+    return load_ingredient_index(os.environ.get(INDEX_PATH_ENV) or DEFAULT_INDEX_PATH)
+
+
+@lru_cache(maxsize=None)
+def get_ingredient_normalizer() -> IngredientNormalizer:
+    """Shared normalizer over the process-wide ingredient index."""
+    return IngredientNormalizer(get_ingredient_index())
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile a JSON ingredient dictionary into a mapped index")
+    parser.add_argument('source', help="JSON list of {name, aliases, role, benefit} entries")
+    parser.add_argument('target', help="Output .idx file")
+    args = parser.parse_args()
+
+    index = IngredientIndex.from_json(args.source)
+    index.save_mapped(args.target)
+    print(f"Wrote {len(index)} keys to {args.target}")
@@ -0,0 +1,170 @@
+"""
+Pipeline Instrumentation
+Opt-in per-agent / per-node timing and memory profiling.
+"""
+import contextvars
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+
+# Metric name → (Prometheus metric, help text, scale from recorded unit)
+METRICS = {
+    "wall_ms": ("pipeline_stage_wall_seconds", "Wall-clock time per pipeline stage call", 1e-3),
+    "cpu_ms": ("pipeline_stage_cpu_seconds", "Thread CPU time per pipeline stage call", 1e-3),
+    "peak_bytes": ("pipeline_stage_peak_alloc_bytes", "Peak traced allocations per pipeline stage call", 1),
+}
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Set while a wrapped call is being measured, so that a stage calling another
+# wrapped method of the same agent (ainvoke → invoke) is recorded once
+_measuring = contextvars.ContextVar("measuring", default=False)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+class PipelineProfiler:
+    """
+    Records wall time, CPU time and peak allocations per pipeline stage.
+
+    Stages are named after the agent (``ParserAgent``) or graph node
+    (``parser``) they wrap; every call appends one sample per metric, and
+    summary() aggregates them into p50/p95/p99 across a whole batch.
+
+    CPU time is per-thread, so parallel branches are measured independently.
+    tracemalloc peaks are process-wide: when branches overlap, each reports
+    the peak reached while it was running, so for exact per-stage memory run
+    the orchestrator with max_concurrency=1. The same holds for async runs
+    (arun, arun_batch): coroutines of concurrent products share a thread, so
+    their CPU time and peaks overlap; profile them with max_concurrency=1.
+
+    Usage:
+        profiler = PipelineProfiler()
+        profiler.instrument_orchestrator(orchestrator)
+        for outputs in orchestrator.run_batch(products):
+            ...
+        print(profiler.to_prometheus())
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.samples: Dict[str, Dict[str, List[float]]] = {}
+        self._lock = threading.Lock()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _record(self, name: str, wall: float, cpu: float, peak: int):
+        with self._lock:
+            stage = self.samples.setdefault(name, {metric: [] for metric in METRICS})
+        stage["wall_ms"].append(wall * 1000)
+        stage["cpu_ms"].append(cpu * 1000)
+        stage["peak_bytes"].append(peak)
+
+    @contextmanager
+    def measure(self, name: str):
+        """Context manager recording one sample for stage `name`."""
+        baseline = 0
+        if self.trace_memory:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            peak = tracemalloc.get_traced_memory()[1] - baseline if self.trace_memory else 0
+            self._record(name, wall, cpu, max(peak, 0))
+
+    def wrap(self, fn: Callable, name: str) -> Callable:
+        """
+        Return `fn` (a function or coroutine function) wrapped so that every
+        call is measured as stage `name`. Calls made while another wrapped
+        call is being measured are not recorded again.
+        """
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _measuring.get():
+                    return await fn(*args, **kwargs)
+                token = _measuring.set(True)
+                try:
+                    with self.measure(name):
+                        return await fn(*args, **kwargs)
+                finally:
+                    _measuring.reset(token)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _measuring.get():
+                return fn(*args, **kwargs)
+            token = _measuring.set(True)
+            try:
+                with self.measure(name):
+                    return fn(*args, **kwargs)
+            finally:
+                _measuring.reset(token)
+        return wrapper
+
+    def instrument_agent(self, agent):
+        """Measure an agent's invoke() and ainvoke() calls in place, keyed by agent.name."""
+        agent.invoke = self.wrap(agent.invoke, agent.name)
+        if hasattr(agent, 'ainvoke'):
+            agent.ainvoke = self.wrap(agent.ainvoke, agent.name)
+        return agent
+
+    def instrument_orchestrator(self, orchestrator):
+        """Measure every agent used by an orchestrator."""
+        for agent in orchestrator.agents.values():
+            self.instrument_agent(agent)
+        return orchestrator
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Per-stage count, mean and p50/p95/p99 for every metric."""
+        result = {}
+        for name, metrics in self.samples.items():
+            result[name] = {}
+            for metric, values in metrics.items():
+                ordered = sorted(values)
+                stats = {
+                    "count": len(ordered),
+                    "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+                }
+                for q in QUANTILES:
+                    stats[f"p{round(q * 100)}"] = percentile(ordered, q)
+                result[name][metric] = stats
+        return result
+
+    def to_json(self) -> str:
+        """Summary as a JSON document."""
+        return json.dumps(self.summary(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Summary in the Prometheus text exposition format."""
+        lines = []
+        for metric, (prom_name, help_text, scale) in METRICS.items():
+            lines.append(f"# HELP {prom_name} {help_text}")
+            lines.append(f"# TYPE {prom_name} summary")
+            for name, metrics in self.samples.items():
+                values = metrics[metric]
+                ordered = sorted(values)
+                for q in QUANTILES:
+                    value = percentile(ordered, q) * scale
+                    lines.append(f'{prom_name}{{stage="{name}",quantile="{q}"}} {value:.9g}')
+                lines.append(f'{prom_name}_sum{{stage="{name}"}} {sum(values) * scale:.9g}')
+                lines.append(f'{prom_name}_count{{stage="{name}"}} {len(values)}')
+        return "\n".join(lines) + "\n"
@@ -1,10 +1,32 @@
 """
 Main Entry Point
 Runs the LangChain-based content generation pipeline.
+
+Usage:
+    python -m src.main                          # single built-in product
+    python -m src.main --input catalog.jsonl    # batch catalog mode (NDJSON)
+    python -m src.main --input catalog.jsonl --format json   # one directory per product
+    python -m src.main --input catalog.jsonl --workers 8 --chunk-size 128
+    python -m src.main --input catalog.jsonl --cache pages.sqlite
+    python -m src.main --input catalog.jsonl --profile prometheus --profile-output stages.prom
+    python -m src.main --input catalog.jsonl --templates   # pages shaped by src/templates
+    python -m src.main --input catalog.jsonl --compare-catalog   # compare with catalog peers
+    python -m src.main --input catalog.jsonl --trusted   # validate input only
+    python -m src.main --input catalog.jsonl --normalized   # questions stored once, referenced by id
+    python -m src.main --input catalog.jsonl --format json --compact   # unindented JSON files
 """
-import json
+import argparse
 import os
+import re
+import time
+from typing import Any, Dict, Optional
+from src.cache import PageCache
+from src.comparison import ComparisonEngine
+from src.instrumentation import PipelineProfiler
 from src.orchestrator import create_orchestrator
+from src.serialization import dumps
+from src.sharding import run_sharded
+from src.streaming import NDJSONPageWriter, normalize_pages, read_jsonl
 
 # Setup paths
 BASE = os.path.dirname(__file__)
@@ -21,9 +43,40 @@ RAW_PRODUCT = {
     'Benefits': 'Brightening, Fades dark spots',
     'How to Use': 'Apply 2–3 drops in the morning before sunscreen',
     'Side Effects': 'Mild tingling for sensitive skin',
-    'Price': '₹699'
+    'Price': '₹699',
+    'Category': 'Serum'
 }
 
+def write_pages(outputs: Dict[str, Any], directory: str, normalized: bool = False,
+                pretty: bool = True):
+    """
+    Write the three generated pages of one product as JSON files, indented
+    for humans unless ``pretty`` is False. With ``normalized``, questions go
+    to questions.json once and the pages reference them by id.
+    """
+    if normalized:
+        outputs = normalize_pages(outputs)
+    files = {
+        'product_page.json': outputs['product_page'],
+        'faq.json': outputs['faq_page'],
+        'comparison_page.json': outputs['comparison_page'],
+    }
+    questions_path = os.path.join(directory, 'questions.json')
+    if normalized:
+        files['questions.json'] = outputs['questions']
+    elif os.path.exists(questions_path):
+        os.remove(questions_path)  # left by an earlier normalized run
+    for filename, page in files.items():
+        with open(os.path.join(directory, filename), 'wb') as f:
+            f.write(dumps(page, pretty=pretty))
+
+
+def _product_dirname(index: int, name: str) -> str:
+    """Stable, filesystem-safe directory name for one product's page set."""
+    slug = re.sub(r'[^a-z0-9]+', '-', (name or '').lower()).strip('-')
+    return f"{index:06d}-{slug}" if slug else f"{index:06d}"
+
+
 def run_pipeline():
     """Execute the LangChain content generation pipeline."""
     print("=" * 60)
@@ -53,15 +106,7 @@ def run_pipeline():
     
     # Write to files
     print(f"[4/4] Writing JSON outputs to {OUTPUT_PATH}...")
-    
-    with open(os.path.join(OUTPUT_PATH, 'product_page.json'), 'w', encoding='utf-8') as f:
-        json.dump(product_page.model_dump(), f, indent=2, ensure_ascii=False)
-    
-    with open(os.path.join(OUTPUT_PATH, 'faq.json'), 'w', encoding='utf-8') as f:
-        json.dump(faq_page.model_dump(), f, indent=2, ensure_ascii=False)
-    
-    with open(os.path.join(OUTPUT_PATH, 'comparison_page.json'), 'w', encoding='utf-8') as f:
-        json.dump(comparison_page.model_dump(), f, indent=2, ensure_ascii=False)
+    write_pages(outputs, OUTPUT_PATH)
     
     # Summary
     print("\n" + "=" * 60)
@@ -77,5 +122,165 @@ def run_pipeline():
     print(f"   Ingredients processed: {len(product_page.ingredients)}")
     print(f"   Content blocks created: 4 (benefits, usage, safety, ingredients)")
 
+def run_batch_pipeline(
+    input_path: str,
+    output_path: str = OUTPUT_PATH,
+    workers: int = 1,
+    chunk_size: int = 64,
+    output_format: str = 'ndjson',
+    cache_path: Optional[str] = None,
+    profile_format: Optional[str] = None,
+    profile_output: Optional[str] = None,
+    direct: bool = False,
+    template_driven: bool = False,
+    compare_catalog: bool = False,
+    trusted: bool = False,
+    normalized: bool = False,
+    compact: bool = False,
+    append: bool = False
+):
+    """
+    Execute the pipeline over a JSONL catalog.
+    
+    Products are streamed through a single orchestrator, or sharded across
+    ``workers`` processes when more than one is requested. With the default
+    ``ndjson`` format pages are written to one compact file per page type;
+    ``json`` writes each product's page set to its own sub-directory of
+    ``output_path``. With ``cache_path``, unchanged products are served from
+    a persistent content-addressed cache (in-process mode only). With
+    ``profile_format`` ('json' or 'prometheus'), per-agent timing and memory
+    percentiles are written to ``profile_output`` (or printed). ``direct``
+    bypasses the LangChain tool wrappers on the hot path, and
+    ``template_driven`` renders pages from the JSON templates in src/templates.
+    With ``compare_catalog``, a first pass over the input indexes the catalog
+    so each product is compared with its most similar catalog product.
+    ``trusted`` validates only the parsed input and builds questions and pages
+    without pydantic validation. ``normalized`` writes each product's
+    questions once (questions.ndjson / questions.json) and has the product
+    and FAQ pages reference them by id. ``compact`` writes ``json`` format
+    pages without indentation. ``append`` adds ``ndjson`` lines to existing
+    output files instead of replacing them.
+    """
+    print("=" * 60)
+    print("Kasparro AI Content Generation System")
+    print("LangChain Multi-Agent Pipeline (batch mode)")
+    print("=" * 60)
+    print(f"\nInput:  {input_path}")
+    print(f"Output: {output_path}")
+    print(f"Workers: {workers} (chunk size {chunk_size})")
+    
+    count = 0
+    start = time.perf_counter()
+    
+    engine = ComparisonEngine.from_raw(read_jsonl(input_path)) if compare_catalog else None
+    catalog = read_jsonl(input_path)
+    cache = PageCache(cache_path) if cache_path else None
+    profiler = PipelineProfiler() if profile_format else None
+    try:
+        if workers > 1:
+            results = run_sharded(catalog, workers=workers, chunk_size=chunk_size,
+                                  direct=direct, template_driven=template_driven,
+                                  comparison_engine=engine, trusted=trusted)
+        else:
+            orchestrator = create_orchestrator(direct=direct, template_driven=template_driven,
+                                               comparison_engine=engine, trusted=trusted)
+            if profiler is not None:
+                profiler.instrument_orchestrator(orchestrator)
+            results = orchestrator.run_batch(catalog, cache=cache)
+        
+        if output_format == 'ndjson':
+            with NDJSONPageWriter(output_path, normalized=normalized, append=append) as writer:
+                for outputs in results:
+                    writer.write(outputs)
+            count = writer.count
+        else:
+            for outputs in results:
+                page = outputs['product_page']
+                name = page['name'] if isinstance(page, dict) else page.name
+                directory = os.path.join(output_path, _product_dirname(count, name))
+                os.makedirs(directory, exist_ok=True)
+                write_pages(outputs, directory, normalized, pretty=not compact)
+                count += 1
+    finally:
+        # Commit and release the SQLite connection even when a product fails
+        if cache is not None:
+            cache.close()
+    elapsed = time.perf_counter() - start
+    throughput = count / elapsed if elapsed > 0 else 0.0
+    
+    print("\n" + "=" * 60)
+    print(f"✅ SUCCESS! Generated page sets for {count} products")
+    print("=" * 60)
+    print(f"\n📊 Statistics:")
+    print(f"   Products processed: {count}")
+    print(f"   Elapsed time: {elapsed:.2f}s")
+    print(f"   Throughput: {throughput:.1f} products/sec")
+    if cache is not None:
+        stats = cache.stats()
+        print(f"   Cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.0%} hit rate)")
+    
+    if profiler is not None:
+        report = profiler.to_json() if profile_format == 'json' else profiler.to_prometheus()
+        if profile_output:
+            with open(profile_output, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"   Profile ({profile_format}) written to {profile_output}")
+        else:
+            print(f"\n{report}")
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Kasparro AI content generation pipeline")
+    parser.add_argument('--input', help="JSONL catalog of raw products (one product per line)")
+    parser.add_argument('--output', default=OUTPUT_PATH, help="Directory for generated pages")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes for batch mode (1 runs in-process)")
+    parser.add_argument('--chunk-size', type=int, default=64,
+                        help="Products sent to a worker process per task")
+    parser.add_argument('--format', choices=['ndjson', 'json'], default='ndjson',
+                        help="Batch output: NDJSON per page type, or JSON files per product")
+    parser.add_argument('--cache', help="SQLite page cache; unchanged products are not regenerated")
+    parser.add_argument('--profile', choices=['json', 'prometheus'],
+                        help="Record per-agent wall/CPU time and peak allocations")
+    parser.add_argument('--profile-output', help="File for the profile report (default: stdout)")
+    parser.add_argument('--direct', action='store_true',
+                        help="Call tool functions directly, skipping LangChain tool overhead")
+    parser.add_argument('--templates', action='store_true',
+                        help="Assemble pages from the JSON templates in src/templates")
+    parser.add_argument('--compare-catalog', action='store_true',
+                        help="Compare each product with its most similar product in the catalog")
+    parser.add_argument('--trusted', action='store_true',
+                        help="Validate parsed input only; build questions and pages without validation")
+    parser.add_argument('--normalized', action='store_true',
+                        help="Write questions once per product and reference them by id from the pages")
+    parser.add_argument('--compact', action='store_true',
+                        help="Write --format json pages without indentation (NDJSON is always compact)")
+    parser.add_argument('--append', action='store_true',
+                        help="Append to existing NDJSON output files instead of replacing them")
+    args = parser.parse_args(argv)
+    
+    if args.cache and args.workers > 1:
+        parser.error("--cache is only supported with --workers 1")
+    if args.cache and args.templates:
+        parser.error("--cache stores page models and cannot be combined with --templates")
+    if args.cache and args.trusted:
+        parser.error("--cache stores page models and cannot be combined with --trusted")
+    if args.cache and args.compare_catalog:
+        parser.error("--cache keys pages by product only and cannot be combined with --compare-catalog")
+    if args.append and args.format != 'ndjson':
+        parser.error("--append is only supported with --format ndjson")
+    if args.profile and args.workers > 1:
+        parser.error("--profile is only supported with --workers 1")
+    
+    if args.input:
+        run_batch_pipeline(args.input, args.output, args.workers, args.chunk_size,
+                           args.format, args.cache, args.profile, args.profile_output,
+                           args.direct, args.templates, args.compare_catalog,
+                           args.trusted, args.normalized, args.compact, args.append)
+    else:
+        run_pipeline()
+
 if __name__ == '__main__':
-    run_pipeline()
+    main()
@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================================
 # INPUT MODELS
@@ -15,6 +15,7 @@ class ProductInput(BaseModel):
     how_to_use: Optional[str] = Field(None, alias="How to Use")
     side_effects: Optional[str] = Field(None, alias="Side Effects")
     price: Optional[str] = Field(None, alias="Price")
+    category: Optional[str] = Field(None, alias="Category")
 
     class Config:
         populate_by_name = True
@@ -33,13 +34,35 @@ class InternalProductModel(BaseModel):
     how_to_use: Optional[str] = None
     side_effects: Optional[str] = None
     price: Optional[float] = None
+    currency: Optional[str] = None
+    category: Optional[str] = None
 
 class QuestionInput(BaseModel):
-    """A generated question with category and answer hint."""
+    """
+    A generated question with category and answer hint.
+    Immutable: static questions are single instances shared by every product.
+    """
+    model_config = ConfigDict(frozen=True)
+
     question: str
     category: str
     answer_hint: str
 
+class CompactQuestion:
+    """
+    Validation-free QuestionInput for the trusted hot path.
+    Same attributes and model_dump(), at a fraction of the construction cost.
+    """
+    __slots__ = ("question", "category", "answer_hint")
+
+    def __init__(self, question: str, category: str, answer_hint: str):
+        self.question = question
+        self.category = category
+        self.answer_hint = answer_hint
+
+    def model_dump(self) -> Dict[str, str]:
+        return {"question": self.question, "category": self.category, "answer_hint": self.answer_hint}
+
 # ============================================================================
 # CONTENT BLOCK MODELS
 # ============================================================================
@@ -73,6 +96,7 @@ class ProductPage(BaseModel):
     """Complete product page structure."""
     name: str
     price: Optional[float]
+    currency: Optional[str] = None
     concentration: Optional[str]
     ingredients: List[Ingredient]
     benefits: Benefits
@@ -29,7 +29,7 @@ def parser_node(state: AgentState) -> Dict[str, Any]:
     Output: product_model (InternalProductModel)
     """
     raw = state['raw_input']
-    product_model = parse_product_data.invoke(raw)
+    product_model = parse_product_data.invoke({"raw": raw})
     return {"product_model": product_model}
 
 # ============================================================================
@@ -43,7 +43,7 @@ def question_generator_node(state: AgentState) -> Dict[str, Any]:
     Output: generated_questions (List[QuestionInput])
     """
     model = state['product_model']
-    questions = generate_questions.invoke(model)
+    questions = generate_questions.invoke({"model": model})
     return {"generated_questions": questions}
 
 # ============================================================================
@@ -58,10 +58,10 @@ def content_blocks_node(state: AgentState) -> Dict[str, Any]:
     """
     model = state['product_model']
     
-    benefits = generate_benefits_block.invoke(model)
-    usage = generate_usage_block.invoke(model)
-    safety = generate_safety_block.invoke(model)
-    ingredients = generate_ingredients_block.invoke(model)
+    benefits = generate_benefits_block.invoke({"model": model})
+    usage = generate_usage_block.invoke({"model": model})
+    safety = generate_safety_block.invoke({"model": model})
+    ingredients = generate_ingredients_block.invoke({"model": model})
     
     return {
         "content_blocks": {
@@ -100,6 +100,7 @@ def assembly_node(state: AgentState) -> Dict[str, Any]:
     product_page = ProductPage(
         name=model.product_name,
         price=model.price,
+        currency=model.currency,
         concentration=model.concentration,
         ingredients=ingredients_list,
         benefits=Benefits(
@@ -135,7 +136,8 @@ def assembly_node(state: AgentState) -> Dict[str, Any]:
         "concentration": "15% Vitamin C",
         "key_ingredients": ["Vitamin C", "Niacinamide", "Ferulic Acid"],
         "benefits": "Brightening, Anti-aging, Pore minimizing",
-        "price": 899.0
+        "price": 899.0,
+        "currency": "INR"
     }
     
     # Generate comparison block
@@ -148,7 +150,8 @@ def assembly_node(state: AgentState) -> Dict[str, Any]:
             "concentration": model.concentration,
             "ingredients": model.key_ingredients,
             "benefits": model.benefits,
-            "price": model.price
+            "price": model.price,
+            "currency": model.currency
         },
         product_b=product_b,
         comparison=comparison
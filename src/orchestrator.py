@@ -2,8 +2,12 @@
 LangChain Orchestrator
 Coordinates multi-agent workflow using LangChain's chain composition.
 """
-from typing import Dict, Any
-from langchain_core.runnables import RunnableSequence, RunnableLambda, RunnableParallel
+import asyncio
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from langchain_core.runnables import RunnableSequence, RunnableLambda, RunnableParallel, RunnableAssign
+from src.cache import PageCache
+from src.models import InternalProductModel
+from src.tools import FIELD_DEPENDENCIES
 from src.agents import (
     ParserAgent,
     QuestionGeneratorAgent,
@@ -16,49 +20,107 @@ from src.agents import (
 class ContentGenerationOrchestrator:
     """
     LangChain-based orchestrator that coordinates multiple agents.
-    Uses RunnableSequence for sequential agent execution.
+    Uses RunnableSequence for sequential agent execution, with the
+    independent generation agents fanned out through RunnableParallel.
+    
+    Args:
+        max_concurrency: Maximum number of worker threads used for the
+            parallel generation step (None lets LangChain decide, 1 runs
+            the branches serially)
+        direct: Have agents call the pure functions behind their tools,
+            bypassing LangChain tool-wrapper overhead on the hot path
+        template_driven: Assemble pages as dictionaries from the JSON
+            templates in src/templates instead of the page models
+        comparison_engine: ComparisonEngine over the catalog being run;
+            each product is then compared with its closest catalog peer
+            instead of the fictional product
+        trusted: Validate only the parsed input; questions and pages are
+            built without pydantic validation (implies direct)
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        direct: bool = False,
+        template_driven: bool = False,
+        comparison_engine=None,
+        trusted: bool = False
+    ):
         # Initialize all agents
-        self.agents = get_all_agents()
+        self.agents = get_all_agents(
+            direct=direct,
+            template_driven=template_driven,
+            comparison_engine=comparison_engine,
+            trusted=trusted
+        )
         self.parser = self.agents["parser"]
         self.question_generator = self.agents["question_generator"]
         self.content_blocks = self.agents["content_blocks"]
         self.comparison = self.agents["comparison"]
         self.assembly = self.agents["assembly"]
+        self.config = {"max_concurrency": max_concurrency}
+        self._chain = None
+        self._page_chain = None
+    
+    @property
+    def chain(self):
+        """Compiled chain, built on first use and reused across runs."""
+        if self._chain is None:
+            self._chain = self.create_chain()
+        return self._chain
     
-    def create_chain(self):
+    @property
+    def page_chain(self):
+        """Compiled chain without the parser, for already-parsed products."""
+        if self._page_chain is None:
+            self._page_chain = self.create_chain(parse=False)
+        return self._page_chain
+    
+    def create_chain(self, parse: bool = True):
         """
         Creates a LangChain RunnableSequence for the content generation workflow.
         
         Flow:
-        1. Parser Agent → product_model
-        2. Parallel: Question Generator + Content Blocks + Comparison
+        1. Parser Agent → product_model (skipped when parse=False, in which
+           case the input must already carry product_model)
+        2. Parallel (RunnableParallel): Question Generator + Content Blocks + Comparison
         3. Assembly Agent → final pages
         """
         
+        # Each step pairs a sync function with an async one, so the same
+        # chain serves both invoke() and ainvoke()
+        
         # Step 1: Parse input
-        parse_step = RunnableLambda(
-            lambda x: {
+        def parse(x):
+            return {
                 "raw_input": x["raw_input"],
                 "product_model": self.parser.invoke(x["raw_input"])
             }
-        )
         
-        # Step 2: Generate content (can run in parallel conceptually)
-        generate_step = RunnableLambda(
-            lambda x: {
-                **x,
-                "questions": self.question_generator.invoke(x["product_model"]),
-                "content_blocks": self.content_blocks.invoke(x["product_model"]),
-                "comparison_data": self.comparison.invoke(x["product_model"])
+        async def aparse(x):
+            return {
+                "raw_input": x["raw_input"],
+                "product_model": await self.parser.ainvoke(x["raw_input"])
             }
-        )
+        
+        parse_step = RunnableLambda(parse, afunc=aparse)
+        
+        # Step 2: Fan out - the three generators only read product_model,
+        # so they run concurrently and latency is the slowest branch
+        def branch(agent):
+            async def ainvoke(x):
+                return await agent.ainvoke(x["product_model"])
+            return RunnableLambda(lambda x: agent.invoke(x["product_model"]), afunc=ainvoke)
+        
+        generate_step = RunnableAssign(RunnableParallel(
+            questions=branch(self.question_generator),
+            content_blocks=branch(self.content_blocks),
+            comparison_data=branch(self.comparison)
+        ))
         
         # Step 3: Assemble final pages
-        assemble_step = RunnableLambda(
-            lambda x: {
+        def assemble(x):
+            return {
                 **x,
                 "outputs": self.assembly.invoke(
                     product_model=x["product_model"],
@@ -67,10 +129,24 @@ class ContentGenerationOrchestrator:
                     comparison_data=x["comparison_data"]
                 )
             }
-        )
+        
+        async def aassemble(x):
+            return {
+                **x,
+                "outputs": await self.assembly.ainvoke(
+                    product_model=x["product_model"],
+                    questions=x["questions"],
+                    content_blocks=x["content_blocks"],
+                    comparison_data=x["comparison_data"]
+                )
+            }
+        
+        assemble_step = RunnableLambda(assemble, afunc=aassemble)
         
         # Compose the chain
-        chain = parse_step | generate_step | assemble_step
+        chain = generate_step | assemble_step
+        if parse:
+            chain = parse_step | chain
         return chain
     
     def run(self, raw_input: Dict[str, Any]) -> Dict[str, Any]:
@@ -83,11 +159,188 @@ class ContentGenerationOrchestrator:
         Returns:
             Dictionary containing all generated pages
         """
-        chain = self.create_chain()
-        result = chain.invoke({"raw_input": raw_input})
+        result = self.chain.invoke({"raw_input": raw_input}, config=self.config)
         return result["outputs"]
+    
+    def run_batch(
+        self,
+        raw_inputs: Iterable[Dict[str, Any]],
+        cache: Optional[PageCache] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the pipeline over many products, streaming results.
+        
+        Every product goes through the same cached chain, and inputs are
+        consumed lazily so arbitrarily large catalogs run in constant memory.
+        
+        Args:
+            raw_inputs: Iterable of raw product data dictionaries
+            cache: Optional page cache; products whose normalized model is
+                unchanged are served from it instead of being regenerated.
+                The cache stores page models keyed by product only, so it
+                cannot be used with trusted or template-driven pages or with a
+                comparison engine (ValueError)
+            
+        Returns:
+            Iterator over the generated pages, one dictionary per input product
+        """
+        if cache is None:
+            chain, config = self.chain, self.config
+            return (
+                chain.invoke({"raw_input": raw_input}, config=config)["outputs"]
+                for raw_input in raw_inputs
+            )
+        if self.assembly.trusted or self.assembly.templates is not None:
+            raise ValueError(
+                "the page cache stores page models; it cannot hold trusted or template-driven pages"
+            )
+        if self.comparison.engine is not None:
+            raise ValueError(
+                "the page cache keys pages by product only; it cannot be used with a comparison engine"
+            )
+        return self._run_cached(raw_inputs, cache)
+    
+    def _run_cached(self, raw_inputs: Iterable[Dict[str, Any]], cache: PageCache) -> Iterator[Dict[str, Any]]:
+        """run_batch() through a page cache."""
+        chain = self.page_chain
+        for raw_input in raw_inputs:
+            product_model = self.parser.invoke(raw_input)
+            key = cache.key_for(product_model)
+            outputs = cache.get(key)
+            if outputs is None:
+                result = chain.invoke(
+                    {"raw_input": raw_input, "product_model": product_model},
+                    config=self.config
+                )
+                outputs = result["outputs"]
+                cache.put(key, outputs)
+            yield outputs
+    
+    def run_incremental(
+        self,
+        raw_input: Dict[str, Any],
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the pipeline, reusing unaffected outputs of a previous run.
+        
+        Only the generators whose input fields (FIELD_DEPENDENCIES) changed
+        since ``previous`` are rerun; pages are always reassembled.
+        
+        Args:
+            raw_input: Raw product data dictionary
+            previous: State returned by an earlier run_incremental() call
+                for the same product, or None for a full run
+            
+        Returns:
+            Pipeline state: product_model, questions, content_blocks,
+            comparison_data, outputs, plus "regenerated" listing the
+            generators that were rerun
+        """
+        if previous is None:
+            state = self.chain.invoke({"raw_input": raw_input}, config=self.config)
+            state["regenerated"] = sorted(FIELD_DEPENDENCIES)
+            return state
+        
+        product_model = self.parser.invoke(raw_input)
+        changed = _changed_fields(previous["product_model"], product_model)
+        stale = sorted(name for name, fields in FIELD_DEPENDENCIES.items() if fields & changed)
+        
+        questions = previous["questions"]
+        if "questions" in stale:
+            questions = self.question_generator.invoke(product_model)
+        
+        content_blocks = dict(previous["content_blocks"])
+        content_blocks.update(self.content_blocks.invoke_blocks(
+            product_model, [name for name in stale if name in content_blocks]
+        ))
+        
+        comparison_data = previous["comparison_data"]
+        if "comparison" in stale:
+            comparison_data = self.comparison.invoke(product_model)
+        
+        outputs = self.assembly.invoke(
+            product_model=product_model,
+            questions=questions,
+            content_blocks=content_blocks,
+            comparison_data=comparison_data
+        )
+        return {
+            "raw_input": raw_input,
+            "product_model": product_model,
+            "questions": questions,
+            "content_blocks": content_blocks,
+            "comparison_data": comparison_data,
+            "outputs": outputs,
+            "regenerated": stale
+        }
+    
+    async def arun(self, raw_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of run() for hosting inside an event loop.
+        
+        Args:
+            raw_input: Raw product data dictionary
+            
+        Returns:
+            Dictionary containing all generated pages
+        """
+        result = await self.chain.ainvoke({"raw_input": raw_input}, config=self.config)
+        return result["outputs"]
+    
+    async def arun_batch(
+        self,
+        raw_inputs: Iterable[Dict[str, Any]],
+        max_concurrency: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the pipeline over many products concurrently.
+        
+        Args:
+            raw_inputs: Iterable of raw product data dictionaries
+            max_concurrency: Maximum number of products in flight at once
+            
+        Returns:
+            List of page dictionaries, in input order
+        
+        ``max_concurrency`` workers pull products from ``raw_inputs`` as they
+        finish, so the input is consumed lazily and at most that many
+        coroutines exist at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        inputs = enumerate(raw_inputs)
+        results: Dict[int, Dict[str, Any]] = {}
+        
+        async def worker():
+            # Workers share one iterator; each next() happens on the event loop
+            for index, raw_input in inputs:
+                results[index] = await self.arun(raw_input)
+        
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        return [results[index] for index in range(len(results))]
+
+
+def _changed_fields(old: InternalProductModel, new: InternalProductModel) -> set:
+    """Names of model fields whose values differ between two products."""
+    return {
+        field for field in InternalProductModel.model_fields
+        if getattr(old, field) != getattr(new, field)
+    }
 
 
-def create_orchestrator() -> ContentGenerationOrchestrator:
+def create_orchestrator(
+    max_concurrency: Optional[int] = None,
+    direct: bool = False,
+    template_driven: bool = False,
+    comparison_engine=None,
+    trusted: bool = False
+) -> ContentGenerationOrchestrator:
     """Factory function to create the orchestrator."""
-    return ContentGenerationOrchestrator()
+    return ContentGenerationOrchestrator(
+        max_concurrency=max_concurrency,
+        direct=direct,
+        template_driven=template_driven,
+        comparison_engine=comparison_engine,
+        trusted=trusted
+    )
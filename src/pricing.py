@@ -0,0 +1,145 @@
+"""
+Price Parsing
+Turns raw catalog prices ("₹699", "Rs. 1,299/-", "$12.50", "1.299,00 €",
+"INR 1,00,000") into an amount and an ISO currency code using precompiled
+patterns, without exception-driven control flow.
+"""
+import re
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+# Currency assumed when a price carries no symbol or code
+DEFAULT_CURRENCY = "INR"
+
+# Symbol or code (upper-cased, trailing '.' removed) → ISO 4217 code
+CURRENCY_ALIASES = {
+    "₹": "INR", "RS": "INR", "INR": "INR",
+    "$": "USD", "US$": "USD", "USD": "USD",
+    "€": "EUR", "EUR": "EUR",
+    "£": "GBP", "GBP": "GBP",
+}
+
+# Display symbol per ISO code; other codes are shown as "CODE amount"
+CURRENCY_SYMBOLS = {"INR": "₹", "USD": "$", "EUR": "€", "GBP": "£"}
+
+# Single-character symbols, for the "₹699" fast path
+_SYMBOLS = {alias: code for alias, code in CURRENCY_ALIASES.items() if len(alias) == 1}
+
+# Symbols and codes as commonly written → ISO code, for the single-pass pattern
+_TOKENS = {
+    "Rs.": "INR", "Rs": "INR",
+    **{alias: code for alias, code in CURRENCY_ALIASES.items() if alias != "RS"}
+}
+
+_CURRENCY = r'(?:US\$|Rs\.?|INR|USD|EUR|GBP|[₹$€£])'
+
+# [MRP] [currency] number [currency] [/-]
+_PRICE = re.compile(
+    rf'\s*(?:MRP:?\s*)?(?P<pre>{_CURRENCY})?\s*'
+    r"(?P<number>\d[\d,.'\u00a0\u202f ]*\d|\d)"
+    rf'\s*(?P<post>{_CURRENCY})?\s*(?:/-)?\s*',
+    re.IGNORECASE
+)
+# Common shapes in one case-sensitive pass with possessive quantifiers (no
+# backtracking): [MRP[:] ][symbol][ ]digits or 1,299 / 1,00,000 groups
+# [.decimals][ ][symbol][/-]; anything else goes through _PRICE
+_COMMON = re.compile(
+    r'(?:MRP:? ?)?+(US\$|Rs\.?|INR|USD|EUR|GBP|[₹$€£])?+ ?+'
+    r'((?:\d{1,3}(?:,\d{2,3})*,\d{3}|\d++)(?:\.\d{1,2})?+)'
+    r' ?+(US\$|Rs\.?|INR|USD|EUR|GBP|[₹$€£])?+(?:/-)?+'
+)
+_GROUPING = re.compile(r"['\u00a0\u202f ]")
+_DECIMAL_COMMA = re.compile(r'\d+,\d{1,2}')
+_COMMA_GROUPS = re.compile(r'\d{1,3}(?:,\d{2,3})+')
+_DOT_GROUPS = re.compile(r'\d{1,3}(?:\.\d{3})+')
+_PLAIN_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+class Price(NamedTuple):
+    """A parsed price."""
+    amount: float
+    currency: str
+
+
+_new_price = tuple.__new__
+
+
+def _normalize_number(number: str) -> Optional[str]:
+    """Digits with at most one '.' decimal point, or None if ambiguous/invalid."""
+    number = _GROUPING.sub('', number)
+    if ',' in number and '.' in number:
+        # The right-most separator is the decimal point: 1,299.00 / 1.299,00
+        if number.rfind(',') > number.rfind('.'):
+            number = number.replace('.', '').replace(',', '.')
+        else:
+            number = number.replace(',', '')
+    elif ',' in number:
+        # 12,50 is a decimal comma; 1,299 and 1,00,000 are grouping
+        if _DECIMAL_COMMA.fullmatch(number):
+            number = number.replace(',', '.')
+        elif _COMMA_GROUPS.fullmatch(number):
+            number = number.replace(',', '')
+    elif number.count('.') > 1 and _DOT_GROUPS.fullmatch(number):
+        number = number.replace('.', '')
+    return number if _PLAIN_NUMBER.fullmatch(number) else None
+
+
+@lru_cache(maxsize=1 << 16)
+def _parse_price_text(value: str, default_currency: str) -> Optional[Price]:
+    match = _PRICE.fullmatch(value)
+    if match is None:
+        return None
+    pre, number, post = match.group('pre', 'number', 'post')
+    if pre and post:
+        return None
+    if not number.isdigit():
+        number = _normalize_number(number)
+        if number is None:
+            return None
+    symbol = pre or post
+    currency = CURRENCY_ALIASES[symbol.upper().rstrip('.')] if symbol else default_currency
+    return Price(float(number), currency)
+
+
+def parse_price(value: Any, default_currency: str = DEFAULT_CURRENCY) -> Optional[Price]:
+    """
+    Parse a raw price into (amount, currency), or None when it is missing or
+    not a price. Numbers are taken as amounts in ``default_currency``.
+
+    "699", "₹699" and the other common shapes (_COMMON) are parsed in a
+    single pass, which costs less than a cache lookup would save; only the
+    rarer texts that need _PRICE are memoized per distinct text.
+    """
+    if value.__class__ is str:
+        # tuple.__new__ skips the generated NamedTuple constructor
+        if value.isdigit() and value.isascii():
+            return _new_price(Price, (float(value), default_currency))
+        currency = _SYMBOLS.get(value[:1])
+        if currency is not None:
+            digits = value[1:]
+            if digits.isdigit() and digits.isascii():
+                return _new_price(Price, (float(digits), currency))
+        match = _COMMON.fullmatch(value)
+        if match is None:
+            return _parse_price_text(value, default_currency)
+        pre, number, post = match.groups()
+        if pre is not None and post is not None:
+            return None
+        currency = _TOKENS.get(pre or post, default_currency)
+        return _new_price(Price, (float(number.replace(',', '')), currency))
+    if value.__class__ is int or value.__class__ is float:
+        return _new_price(Price, (float(value), default_currency))
+    return None
+
+
+def same_currency(a: Optional[str], b: Optional[str]) -> bool:
+    """Whether two prices can be compared; a missing currency is DEFAULT_CURRENCY."""
+    return (a or DEFAULT_CURRENCY) == (b or DEFAULT_CURRENCY)
+
+
+def format_price(amount: float, currency: Optional[str] = None) -> str:
+    """Display form of a price: "₹699", "$12.50", "CHF 40"."""
+    text = str(int(amount)) if float(amount).is_integer() else f"{amount:.2f}"
+    currency = currency or DEFAULT_CURRENCY
+    symbol = CURRENCY_SYMBOLS.get(currency)
+    return f"{symbol}{text}" if symbol else f"{currency} {text}"
@@ -0,0 +1,214 @@
+"""
+Question Bank
+FAQ questions as data (src/data/questions.json), compiled once: questions
+without product placeholders become shared singletons, the others
+precompiled formatters that declare the product fields they read. Each
+product's selection (by product category, field availability and
+per-category quotas) is a precomputed lookup.
+"""
+import json
+import os
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.models import InternalProductModel, QuestionInput
+from src.pricing import format_price
+
+
+class QuestionSpec(NamedTuple):
+    """
+    One question-bank entry. ``question`` and ``answer_hint`` may reference
+    product fields as {field}; ``fallback`` replaces the answer when a
+    referenced field is empty. Entries sharing an ``id`` (default: the
+    question text) are variants of one question: a variant for the product's
+    category wins over a generic one, and variants whose ``requires`` fields
+    are empty are skipped.
+    """
+    category: str
+    question: str
+    answer_hint: str
+    fallback: Optional[str] = None
+    product_categories: Tuple[str, ...] = ()
+    requires: Tuple[str, ...] = ()
+    id: Optional[str] = None
+
+
+DEFAULT_BANK_PATH = os.path.join(os.path.dirname(__file__), 'data', 'questions.json')
+
+# Set to a question bank .json file to override the default
+BANK_PATH_ENV = "QUESTION_BANK_PATH"
+
+
+def _join(field: str) -> Callable[[InternalProductModel], str]:
+    return lambda model: ", ".join(getattr(model, field))
+
+
+def _text(field: str) -> Callable[[InternalProductModel], str]:
+    return lambda model: str(getattr(model, field))
+
+
+def _price(model: InternalProductModel) -> str:
+    return format_price(model.price, model.currency) if model.price else ""
+
+
+# Placeholders (model field names) with a custom rendering → (model fields it
+# reads, renderer); other fields render with str()
+PLACEHOLDERS: Dict[str, tuple] = {
+    "key_ingredients": (frozenset({"key_ingredients"}), _join("key_ingredients")),
+    "skin_type": (frozenset({"skin_type"}), _join("skin_type")),
+    "price": (frozenset({"price", "currency"}), _price),
+}
+
+
+def _placeholders(text: str) -> List[str]:
+    return [name for _, name, _, _ in Formatter().parse(text) if name]
+
+
+def _category_key(category: Any) -> Optional[str]:
+    return category.strip().lower() if isinstance(category, str) else None
+
+
+class CompiledQuestion:
+    """A QuestionSpec with its placeholders resolved ahead of time."""
+
+    __slots__ = ("id", "category", "question", "answer_hint", "fallback", "product_categories",
+                 "requires", "placeholders", "fields", "is_static", "question_is_static",
+                 "_singletons")
+
+    def __init__(self, spec: QuestionSpec):
+        self.id = spec.id or spec.question
+        self.category = spec.category
+        self.question = spec.question
+        self.answer_hint = spec.answer_hint
+        self.fallback = spec.fallback
+        self.product_categories = frozenset(_category_key(c) for c in spec.product_categories)
+        self.requires = frozenset(spec.requires)
+        self.question_is_static = not _placeholders(spec.question)
+        self.placeholders = tuple(dict.fromkeys(
+            _placeholders(spec.question) + _placeholders(spec.answer_hint)
+        ))
+        for name in self.placeholders + tuple(spec.requires):
+            if name not in InternalProductModel.model_fields:
+                raise ValueError(f"question {spec.question!r} references unknown field {name!r}")
+        self.fields: FrozenSet[str] = self.requires.union(*(
+            PLACEHOLDERS[name][0] if name in PLACEHOLDERS else {name}
+            for name in self.placeholders
+        ))
+        self.is_static = not self.placeholders
+        self._singletons: Dict[Any, Any] = {}
+
+    def singleton(self, make) -> Any:
+        """The shared instance of a static question, built once per constructor."""
+        question = self._singletons.get(make)
+        if question is None:
+            question = self._singletons[make] = make(
+                question=self.question, category=self.category, answer_hint=self.answer_hint
+            )
+        return question
+
+    def render(self, model: InternalProductModel, values: Dict[str, str], make) -> Any:
+        if self.fallback is not None and not all(getattr(model, f) for f in self.placeholders):
+            answer = self.fallback
+        else:
+            answer = self.answer_hint.format_map(values)
+        question = self.question if self.question_is_static else self.question.format_map(values)
+        return make(question=question, category=self.category, answer_hint=answer)
+
+
+class Selection(NamedTuple):
+    """The questions chosen for one (product category, available fields) case."""
+    questions: Tuple[CompiledQuestion, ...]
+    renderers: Tuple[Tuple[str, Callable[[InternalProductModel], str]], ...]
+
+
+class QuestionBank:
+    """
+    Compiled question bank with per-category quotas.
+
+    A product's questions depend only on its (normalized) product category
+    and on which ``requires`` fields it has, so selections are computed once
+    per such case and looked up afterwards; building a product's questions
+    renders only the placeholders its selection reads.
+    """
+
+    def __init__(self, specs: Iterable[QuestionSpec], quotas: Dict[str, int]):
+        self.questions = [CompiledQuestion(spec) for spec in specs]
+        self.quotas = dict(quotas)
+        for question in self.questions:
+            if question.category not in self.quotas:
+                raise ValueError(
+                    f"question {question.question!r} has category {question.category!r} without a quota"
+                )
+        self.product_categories = frozenset().union(*(q.product_categories for q in self.questions))
+        self.requires = tuple(sorted(frozenset().union(*(q.requires for q in self.questions))))
+        self.fields: FrozenSet[str] = frozenset().union(*(q.fields for q in self.questions))
+        if self.product_categories:
+            self.fields |= {"category"}
+        self._category_keys: Dict[Any, Optional[str]] = {}
+        self._selections: Dict[tuple, Selection] = {}
+
+    def _select(self, category: Optional[str], available: FrozenSet[str]) -> Selection:
+        chosen: Dict[str, CompiledQuestion] = {}
+        for question in self.questions:
+            if question.product_categories and category not in question.product_categories:
+                continue
+            if not question.requires <= available:
+                continue
+            current = chosen.get(question.id)
+            if current is None or (question.product_categories and not current.product_categories):
+                chosen[question.id] = question
+
+        remaining = dict(self.quotas)
+        selected = []
+        for question in chosen.values():
+            if remaining[question.category] > 0:
+                remaining[question.category] -= 1
+                selected.append(question)
+
+        placeholders = dict.fromkeys(p for q in selected for p in q.placeholders)
+        return Selection(tuple(selected), tuple(
+            (name, PLACEHOLDERS[name][1] if name in PLACEHOLDERS else _text(name))
+            for name in placeholders
+        ))
+
+    def select(self, model: InternalProductModel) -> Selection:
+        """The product's selection, computed on the first product of its case."""
+        raw_category = model.category
+        category = self._category_keys.get(raw_category, False)
+        if category is False:
+            category = _category_key(raw_category)
+            if category not in self.product_categories:
+                category = None
+            self._category_keys[raw_category] = category
+        key = (category, tuple(bool(getattr(model, f)) for f in self.requires))
+        selection = self._selections.get(key)
+        if selection is None:
+            available = frozenset(f for f, present in zip(self.requires, key[1]) if present)
+            selection = self._selections[key] = self._select(category, available)
+        return selection
+
+    def build(self, model: InternalProductModel, make=QuestionInput) -> List[Any]:
+        questions, renderers = self.select(model)
+        values = {name: render(model) for name, render in renderers}
+        return [
+            q.singleton(make) if q.is_static else q.render(model, values, make)
+            for q in questions
+        ]
+
+
+def load_question_bank(path: str) -> QuestionBank:
+    """Load a question bank from its JSON file (``quotas`` and ``questions``)."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    specs = [
+        QuestionSpec(**{k: tuple(v) if isinstance(v, list) else v for k, v in entry.items()})
+        for entry in data["questions"]
+    ]
+    return QuestionBank(specs, data["quotas"])
+
+
+@lru_cache(maxsize=None)
+def get_question_bank() -> QuestionBank:
+    """Shared question bank, loaded on first use only."""
+    return load_question_bank(os.environ.get(BANK_PATH_ENV) or DEFAULT_BANK_PATH)
@@ -0,0 +1,45 @@
+"""
+Page Serialization
+Encodes pages as UTF-8 JSON bytes without the stdlib encoder on the hot path:
+page models go through pydantic's Rust serializer, plain dict pages through
+orjson when it is installed. Compact output matches
+json.dumps(..., ensure_ascii=False, separators=(',', ':')) and pretty output
+json.dumps(..., ensure_ascii=False, indent=2).
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _dumps_stdlib(data: Any, pretty: bool) -> bytes:
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps(page: Any, pretty: bool = False) -> bytes:
+    """
+    JSON bytes of a page model, a CompactQuestion or a plain dict; compact by
+    default, indented by two spaces with ``pretty``.
+    """
+    if not isinstance(page, dict):
+        serializer = getattr(page, '__pydantic_serializer__', None)
+        if serializer is not None and not (pretty and orjson is not None):
+            # model_dump_json without the bytes → str → bytes round trip
+            return serializer.to_json(page, indent=2 if pretty else None)
+        page = page.model_dump()
+    if orjson is not None:
+        try:
+            return orjson.dumps(page, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:  # e.g. integers beyond 64 bits; the stdlib handles them
+            pass
+    return _dumps_stdlib(page, pretty)
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON document (str or bytes)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
@@ -0,0 +1,91 @@
+"""
+Sharded Catalog Runner
+Spreads a product catalog across worker processes for CPU-bound throughput.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from src.orchestrator import create_orchestrator
+
+# One orchestrator per worker process, created by the pool initializer
+_worker_orchestrator = None
+
+
+def _init_worker(
+    direct: bool,
+    template_driven: bool,
+    comparison_engine=None,
+    trusted: bool = False
+):
+    """Pool initializer: build the worker's orchestrator once."""
+    global _worker_orchestrator
+    # The pipeline is CPU-bound, so threads inside a worker only add overhead
+    _worker_orchestrator = create_orchestrator(
+        max_concurrency=1, direct=direct, template_driven=template_driven,
+        comparison_engine=comparison_engine, trusted=trusted
+    )
+
+
+def _run_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run one chunk of raw products through the worker's orchestrator."""
+    return list(_worker_orchestrator.run_batch(chunk))
+
+
+def _chunked(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Split an iterable into lists of at most `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_sharded(
+    raw_inputs: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    direct: bool = False,
+    template_driven: bool = False,
+    comparison_engine=None,
+    trusted: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Execute the pipeline over a catalog using a pool of worker processes.
+
+    Inputs are consumed lazily and split into chunks; at most two chunks per
+    worker are in flight at once, so memory stays bounded for large catalogs.
+
+    Args:
+        raw_inputs: Iterable of raw product data dictionaries
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of products sent to a worker per task
+        direct: Run worker agents in direct (tool-wrapper-free) mode
+        template_driven: Assemble pages from the JSON templates
+        comparison_engine: Catalog ComparisonEngine, sent to each worker once
+        trusted: Skip pydantic validation after parsing in the workers
+
+    Yields:
+        Dictionary containing all generated pages, in input order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker,
+        initargs=(direct, template_driven, comparison_engine, trusted)
+    ) as pool:
+        pending = deque()
+
+        for chunk in _chunked(raw_inputs, chunk_size):
+            pending.append(pool.submit(_run_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
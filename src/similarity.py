@@ -0,0 +1,108 @@
+"""
+Vectorized Product Similarity
+Pairwise ingredient overlap, unique counts and price differences for a whole
+group of products (e.g. one category) computed as sparse matrix products.
+
+Requires the optional numpy and scipy packages (pip install numpy scipy).
+"""
+from typing import Dict, Any, List, Sequence
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # optional dependency
+    np = sparse = None
+
+from src.ingredients import get_ingredient_normalizer
+from src.models import InternalProductModel
+from src.pricing import DEFAULT_CURRENCY
+
+
+class SimilarityMatrix:
+    """
+    All-pairs comparison of a group of products.
+
+    Products are encoded once as rows of a sparse 0/1 incidence matrix over
+    canonical ingredients, so the shared-ingredient counts of every pair are a
+    single sparse product ``X @ X.T``; unique counts and price differences
+    follow by broadcasting. Entry ``[a, b]`` of every matrix corresponds to
+    ``generate_comparison_block(products[a], products[b])``.
+
+    The dense matrices take n² cells, which suits category-sized groups (a
+    few thousand products); for nearest competitors across a whole catalog
+    use src.comparison.ComparisonEngine.
+    """
+
+    def __init__(self, products: Sequence[InternalProductModel]):
+        if np is None:
+            raise ImportError("SimilarityMatrix requires numpy and scipy (pip install numpy scipy)")
+        canonical = get_ingredient_normalizer().canonical
+        vocabulary: Dict[str, int] = {}
+        indptr, indices = [0], []
+        for product in products:
+            row = {vocabulary.setdefault(canonical(i).lower(), len(vocabulary))
+                   for i in product.key_ingredients}
+            indices.extend(sorted(row))
+            indptr.append(len(indices))
+
+        self.ingredients: List[str] = list(vocabulary)
+        self.incidence = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(products), len(vocabulary))
+        )
+        self.sizes = np.diff(self.incidence.indptr)
+        # Unknown prices count as 0, as in generate_comparison_block
+        self.prices = np.array([p.price or 0.0 for p in products], dtype=np.float64)
+        currencies: Dict[str, int] = {}
+        self.currencies = np.array(
+            [currencies.setdefault(p.currency or DEFAULT_CURRENCY, len(currencies)) for p in products],
+            dtype=np.int32
+        )
+        self._common = (self.incidence @ self.incidence.T).toarray()
+
+    def __len__(self) -> int:
+        return self.incidence.shape[0]
+
+    def common_counts(self) -> "np.ndarray":
+        """[a, b] = number of ingredients shared by products a and b."""
+        return self._common
+
+    def unique_counts(self) -> tuple:
+        """(unique_to_a, unique_to_b) count matrices."""
+        return self.sizes[:, None] - self._common, self.sizes[None, :] - self._common
+
+    def price_differences(self) -> "np.ndarray":
+        """[a, b] = price of b minus price of a; NaN when their currencies differ."""
+        differences = self.prices[None, :] - self.prices[:, None]
+        differences[self.currencies[:, None] != self.currencies[None, :]] = np.nan
+        return differences
+
+    def jaccard(self) -> "np.ndarray":
+        """[a, b] = ingredient Jaccard similarity (0 when both lists are empty)."""
+        union = self.sizes[:, None] + self.sizes[None, :] - self._common
+        return np.divide(self._common, union, out=np.zeros(self._common.shape), where=union > 0)
+
+    def counts(self) -> Dict[str, "np.ndarray"]:
+        """Bulk form of the comparison block fields: one matrix per field."""
+        unique_to_a, unique_to_b = self.unique_counts()
+        return {
+            "common_ingredients": self.common_counts(),
+            "unique_to_a": unique_to_a,
+            "unique_to_b": unique_to_b,
+            "price_difference": self.price_differences(),
+        }
+
+    def comparison(self, a: int, b: int) -> Dict[str, Any]:
+        """Comparison block fields for one pair, with ingredient names."""
+        row_a = self.incidence.indices[self.incidence.indptr[a]:self.incidence.indptr[a + 1]]
+        row_b = self.incidence.indices[self.incidence.indptr[b]:self.incidence.indptr[b + 1]]
+        names = self.ingredients
+        return {
+            "common_ingredients": [names[i] for i in np.intersect1d(row_a, row_b, assume_unique=True)],
+            "unique_to_a": [names[i] for i in np.setdiff1d(row_a, row_b, assume_unique=True)],
+            "unique_to_b": [names[i] for i in np.setdiff1d(row_b, row_a, assume_unique=True)],
+            "price_difference": (
+                float(self.prices[b] - self.prices[a])
+                if self.currencies[a] == self.currencies[b] else None
+            ),
+        }
@@ -10,6 +10,8 @@ class AgentState(TypedDict):
     """
     Shared state for the content generation pipeline.
     Each field represents the output of a specific processing stage.
+    Every field is written by a single node, so the generator nodes that run
+    in the same step need no reducers.
     """
     # Input
     raw_input: Dict[str, Any]
@@ -0,0 +1,265 @@
+"""
+Streaming I/O
+Constant-memory JSONL input reader and NDJSON page writers for catalog runs.
+"""
+import operator
+import os
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+from src.serialization import dumps, loads
+
+# Output file per page type
+PAGE_FILES = {
+    "product_page": "product_pages.ndjson",
+    "faq_page": "faq.ndjson",
+    "comparison_page": "comparison_pages.ndjson",
+}
+
+# Extra output of normalized mode: each product's questions, stored once
+QUESTIONS_FILE = "questions.ndjson"
+
+
+def page_to_dict(page: Any) -> Dict[str, Any]:
+    """JSON-ready form of a page: a page model, or an already-rendered dict."""
+    if isinstance(page, dict):
+        return page
+    return page.model_dump() if hasattr(page, 'model_dump') else page
+
+
+def _page_questions(page: Any) -> Optional[List[Any]]:
+    # A model's fields live in its __dict__; getattr on a missing one costs an exception
+    return (page if isinstance(page, dict) else page.__dict__).get('questions')
+
+
+def _without_questions(page: Any, ids: Sequence[int]) -> Dict[str, Any]:
+    ids = list(ids)
+    if isinstance(page, dict):
+        return {**page, 'questions': ids}
+    data = page.model_dump(exclude={'questions'})
+    return {k: ids if k == 'questions' else data[k] for k in page.__class__.model_fields}
+
+
+def _faq_records(faq_page: Any) -> List[Dict[str, Any]]:
+    questions = _page_questions(faq_page)
+    if questions is None:
+        return []
+    if isinstance(faq_page, dict):
+        return [page_to_dict(q) for q in questions]
+    return faq_page.model_dump(include={'questions'})['questions']
+
+
+def _question_ids(outputs: Dict[str, Any]) -> Tuple[Dict[str, Sequence[int]], Optional[List[Dict[str, Any]]]]:
+    """
+    Question ids of every page with questions (a range for a leading slice of
+    the FAQ's), and the question records when other pages add questions the
+    FAQ lacks (None when the FAQ's are all).
+    """
+    faq_questions = _page_questions(outputs['faq_page'])
+    if faq_questions is None:
+        faq_questions, ids = [], {}
+    else:
+        ids = {'faq_page': range(len(faq_questions))}
+    records = ids_by_object = ids_by_value = None
+    for key in ('product_page', 'comparison_page'):
+        questions = _page_questions(outputs[key])
+        if questions is None:
+            continue
+        if len(questions) <= len(faq_questions) and all(map(operator.is_, questions, faq_questions)):
+            # The usual case: a leading slice of the FAQ's questions
+            ids[key] = range(len(questions))
+            continue
+        if records is None:
+            records = _faq_records(outputs['faq_page'])
+            ids_by_object = {id(q): i for i, q in enumerate(faq_questions)}
+            ids_by_value = {tuple(r.items()): i for i, r in enumerate(records)}
+        page_ids = []
+        for question in questions:
+            qid = ids_by_object.get(id(question))
+            if qid is None:
+                data = page_to_dict(question)
+                qid = ids_by_value.setdefault(tuple(data.items()), len(records))
+                if qid == len(records):
+                    records.append(data)
+            page_ids.append(qid)
+        ids[key] = page_ids
+    return ids, records
+
+
+def normalize_pages(outputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON-ready page set with each question stored once.
+
+    The product's questions are returned under ``"questions"`` as
+    ``{"questions": [...]}``, a question's id being its position there, and
+    the pages' question lists are replaced by lists of ids. The FAQ page's
+    questions come first, in order; questions of other pages are matched to
+    them by object (the assembled pages share them) or else by value, and
+    appended if new. Pages without questions are returned unchanged.
+    """
+    ids, records = _question_ids(outputs)
+    if records is None:
+        records = _faq_records(outputs['faq_page'])
+    pages = {key: _without_questions(outputs[key], ids[key]) if key in ids else outputs[key]
+             for key in PAGE_FILES}
+    return {"questions": {"questions": records}, **pages}
+
+
+@lru_cache(maxsize=None)
+def _model_questions_last(model_class: type) -> bool:
+    return next(reversed(model_class.model_fields), None) == 'questions'
+
+
+def _questions_last(page: Any) -> bool:
+    if isinstance(page, dict):
+        return next(reversed(page), None) == 'questions'
+    return _model_questions_last(page.__class__)
+
+
+@lru_cache(maxsize=256)
+def _range_json(count: int) -> bytes:
+    return ','.join(map(str, range(count))).encode()
+
+
+def _close_with_ids(head: bytes, ids: Sequence[int]) -> bytes:
+    # head: a page's JSON up to its questions, without the closing brace
+    key = b'"questions":[' if head.endswith(b'{') else b',"questions":['
+    id_json = _range_json(len(ids)) if type(ids) is range else ','.join(map(str, ids)).encode()
+    return head + key + id_json + b']}'
+
+
+def _dumps_with_ids(page: Any, ids: Sequence[int]) -> bytes:
+    if isinstance(page, dict) or not _questions_last(page):
+        return dumps(_without_questions(page, ids))
+    return _close_with_ids(page.__pydantic_serializer__.to_json(page, exclude={'questions'})[:-1], ids)
+
+
+def dumps_normalized(outputs: Dict[str, Any]) -> Dict[str, bytes]:
+    """
+    Compact JSON bytes of normalize_pages(outputs), per key, without
+    rebuilding page models as dicts: a model page is serialized without its
+    questions and the ids are spliced in, and the questions line is cut from
+    the FAQ page's JSON.
+    """
+    ids, records = _question_ids(outputs)
+    faq_page = outputs['faq_page']
+    lines = {}
+    if records is None and 'faq_page' in ids and _questions_last(faq_page):
+        # The questions close the FAQ's JSON; no string can hold an unescaped quote
+        data = dumps(faq_page)
+        split = data.rindex(b'"questions":[')
+        lines['questions'] = b'{' + data[split:]
+        head = data[:split - 1] if data[split - 1:split] == b',' else data[:split]
+        lines['faq_page'] = _close_with_ids(head, ids['faq_page'])
+    else:
+        lines['questions'] = dumps({"questions": _faq_records(faq_page) if records is None else records})
+    for key in PAGE_FILES:
+        if key not in lines:
+            lines[key] = _dumps_with_ids(outputs[key], ids[key]) if key in ids else dumps(outputs[key])
+    return lines
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream raw product dictionaries from a JSONL file, skipping blank lines."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield loads(line)
+
+
+def _count_lines(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+
+
+class NDJSONPageWriter:
+    """
+    Writes compact NDJSON lines, one file per page type.
+
+    Existing output files are replaced, and a questions.ndjson left by an
+    earlier normalized run is removed. With ``append``, new lines are added
+    to them instead, after checking that they hold the same number of lines
+    (a run that died partway leaves them misaligned) and the same layout.
+
+    With ``normalized``, questions are written once per product to
+    questions.ndjson and pages reference them by id (see normalize_pages and
+    dumps_normalized); line N of every file belongs to the same product.
+
+    Pages are encoded by src.serialization (pydantic's Rust serializer or
+    orjson). Serialized lines are buffered in memory and written in batches of
+    ``flush_every`` products, so a catalog of any size is written with a
+    fixed-size buffer and a small number of write calls.
+
+    Usage:
+        with NDJSONPageWriter(output_dir) as writer:
+            for outputs in orchestrator.run_batch(products):
+                writer.write(outputs)
+    """
+
+    def __init__(self, output_dir: str, flush_every: int = 1000, normalized: bool = False,
+                 append: bool = False):
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+        self.output_dir = output_dir
+        self.flush_every = flush_every
+        self.normalized = normalized
+        self.append = append
+        self.count = 0
+        self._filenames = dict(PAGE_FILES, questions=QUESTIONS_FILE) if normalized else PAGE_FILES
+        self._buffers: Dict[str, List[bytes]] = {key: [] for key in self._filenames}
+        self._files = {}
+
+    def open(self) -> "NDJSONPageWriter":
+        """Open (or, with ``append``, continue) the per-page-type output files."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        paths = {key: os.path.join(self.output_dir, name) for key, name in self._filenames.items()}
+        stale_questions = os.path.join(self.output_dir, QUESTIONS_FILE)
+        if self.append:
+            lines = {path: _count_lines(path) for path in paths.values()}
+            if len(set(lines.values())) > 1:
+                raise ValueError(f"cannot append to NDJSON files with different line counts: {lines}")
+            if not self.normalized and os.path.exists(stale_questions):
+                raise ValueError(f"cannot append full pages to normalized output in {self.output_dir}")
+        elif not self.normalized and os.path.exists(stale_questions):
+            # Left by an earlier normalized run; it no longer lines up with the pages
+            os.remove(stale_questions)
+        for key, path in paths.items():
+            self._files[key] = open(path, 'ab' if self.append else 'wb')
+        return self
+
+    def write(self, outputs: Dict[str, Any]):
+        """Buffer one product's page set, flushing when the batch is full."""
+        if self.normalized:
+            lines = dumps_normalized(outputs)
+        else:
+            lines = {key: dumps(outputs[key]) for key in self._buffers}
+        for key, buffer in self._buffers.items():
+            buffer.append(lines[key] + b'\n')
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered lines to disk."""
+        for key, buffer in self._buffers.items():
+            if buffer:
+                self._files[key].write(b''.join(buffer))
+                self._files[key].flush()
+                buffer.clear()
+
+    def close(self):
+        """Flush remaining lines and close the output files."""
+        if self._files:
+            self.flush()
+            for f in self._files.values():
+                f.close()
+            self._files = {}
+
+    def __enter__(self) -> "NDJSONPageWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,228 @@
+"""
+Template-Driven Page Assembly
+Loads the JSON page templates once, validates them and compiles every field
+into an extractor closure, so rendering a product never touches the
+filesystem or re-interprets the template.
+"""
+import json
+import os
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Any, Callable, List
+
+from src.pricing import format_price
+
+TEMPLATES_PATH = os.path.join(os.path.dirname(__file__), 'templates')
+
+# Output page → template file
+TEMPLATE_FILES = {
+    "product_page": "product_template.json",
+    "faq_page": "faq_template.json",
+    "comparison_page": "comparison_template.json",
+}
+
+# Template block name → key of the generated content it reads
+BLOCKS = {
+    "generate_benefits_block": "benefits",
+    "generate_usage_block": "usage",
+    "generate_safety_block": "safety",
+    "generate_ingredients_block": "ingredients",
+    "generate_comparison_block": "comparison",
+}
+
+FIELD_TYPES = {"string", "number", "array", "object"}
+RULES = {"concat", "generate", "timestamp", "extract_unique"}
+
+# Value format → formatter(value, ctx); missing values stay null
+FORMATS = {
+    "currency": lambda value, ctx: format_price(value, ctx["model"].currency),
+    "currency_inr": lambda value, ctx: format_price(value, "INR"),
+}
+
+MODEL_REF = re.compile(r'\{\{model\.([a-z_]+)\}\}')
+
+# An extractor maps the render context to one field value
+Extractor = Callable[[Dict[str, Any]], Any]
+
+
+class TemplateError(ValueError):
+    """Raised when a template is malformed or cannot be rendered."""
+
+
+# ============================================================================
+# LOADING & VALIDATION
+# ============================================================================
+
+def load_templates(path: str = TEMPLATES_PATH) -> Dict[str, Dict[str, Any]]:
+    """Read and validate all page templates from `path`."""
+    templates = {}
+    for page, filename in TEMPLATE_FILES.items():
+        with open(os.path.join(path, filename), 'r', encoding='utf-8') as f:
+            template = json.load(f)
+        validate_template(template, filename)
+        templates[page] = template
+    return templates
+
+
+def validate_template(template: Dict[str, Any], name: str = "template"):
+    """Check that every field declares a known type and a resolvable spec."""
+    fields = template.get("fields")
+    if not isinstance(fields, dict) or not fields:
+        raise TemplateError(f"{name}: 'fields' must be a non-empty object")
+
+    for field, spec in fields.items():
+        where = f"{name}: field '{field}'"
+        if spec.get("type") not in FIELD_TYPES:
+            raise TemplateError(f"{where} has unknown type {spec.get('type')!r}")
+        if "block" in spec and spec["block"] not in BLOCKS:
+            raise TemplateError(f"{where} references unknown block {spec['block']!r}")
+        if "rule" in spec and spec["rule"] not in RULES:
+            raise TemplateError(f"{where} uses unknown rule {spec['rule']!r}")
+        if "format" in spec and spec["format"] not in FORMATS:
+            raise TemplateError(f"{where} uses unknown format {spec['format']!r}")
+        if "format" in spec and spec["type"] != "string":
+            raise TemplateError(f"{where} format {spec['format']!r} produces a string")
+        if spec.get("rule") in ("concat", "generate") and "value" not in spec:
+            raise TemplateError(f"{where} rule '{spec['rule']}' needs a 'value'")
+        if not any(key in spec for key in ("block", "rule", "source", "value")):
+            raise TemplateError(f"{where} needs one of block, rule, source or value")
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+def _compile_text(text: str) -> Extractor:
+    """Compile a '{{model.x}}' string into literal/attribute segments."""
+    parts = MODEL_REF.split(text)
+    if len(parts) == 1:
+        return lambda ctx: text
+    texts, getters = parts[0::2], [attrgetter(key) for key in parts[1::2]]
+
+    def render(ctx):
+        model = ctx["model"]
+        out = [texts[0]]
+        for getter, literal in zip(getters, texts[1:]):
+            value = getter(model)
+            out.append(str(value) if value is not None else '')
+            out.append(literal)
+        return ''.join(out)
+    return render
+
+
+def _compile_source(field: str, spec: Dict[str, Any]) -> Extractor:
+    source = spec["source"]
+
+    if source == "questions":
+        limit = spec.get("max_items")
+        minimum = spec.get("min_items", 0)
+
+        def questions(ctx):
+            items = ctx["questions"]
+            if len(items) < minimum:
+                raise TemplateError(f"field '{field}' needs at least {minimum} questions")
+            return [q.model_dump() for q in (items[:limit] if limit else items)]
+        return questions
+
+    if source == "model":
+        getters = [(name, attrgetter(name)) for name in spec.get("fields", [])]
+        return lambda ctx: {name: getter(ctx["model"]) for name, getter in getters}
+
+    if source.startswith("model."):
+        getter = attrgetter(source[len("model."):])
+        return lambda ctx: getter(ctx["model"])
+
+    if source == "fictional_product":
+        return lambda ctx: ctx["comparison_data"]["product_b"]
+
+    raise TemplateError(f"field '{field}' has unknown source {source!r}")
+
+
+def _compile_rule(field: str, spec: Dict[str, Any]) -> Extractor:
+    rule = spec["rule"]
+
+    if rule in ("concat", "generate"):
+        return _compile_text(spec["value"])
+
+    if rule == "timestamp":
+        return lambda ctx: ctx["timestamp"]
+
+    # extract_unique: ordered unique values of one attribute of a list source
+    collection, _, attribute = spec.get("source", "").partition(".")
+    if collection != "questions" or not attribute:
+        raise TemplateError(f"field '{field}' extract_unique needs a 'questions.<attr>' source")
+    getter = attrgetter(attribute)
+    return lambda ctx: list(dict.fromkeys(getter(q) for q in ctx["questions"]))
+
+
+def compile_field(field: str, spec: Dict[str, Any]) -> Extractor:
+    """Compile one template field into an extractor closure."""
+    if "format" in spec:
+        extract, formatter = _compile_value(field, spec), FORMATS[spec["format"]]
+
+        def formatted(ctx):
+            value = extract(ctx)
+            return formatter(value, ctx) if value is not None else None
+        return formatted
+    return _compile_value(field, spec)
+
+
+def _compile_value(field: str, spec: Dict[str, Any]) -> Extractor:
+    if "block" in spec:
+        key = BLOCKS[spec["block"]]
+        if key == "comparison":
+            return lambda ctx: ctx["comparison_data"]["comparison"]
+        return lambda ctx: ctx["content_blocks"][key]
+    if "rule" in spec:
+        return _compile_rule(field, spec)
+    if "source" in spec:
+        return _compile_source(field, spec)
+    value = spec["value"]
+    return lambda ctx: value
+
+
+class CompiledPageTemplate:
+    """A page template compiled into (field, extractor) pairs."""
+
+    def __init__(self, template: Dict[str, Any]):
+        self.name = template.get("template_name")
+        self.fields: List[tuple] = [
+            (field, compile_field(field, spec)) for field, spec in template["fields"].items()
+        ]
+
+    def render(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: extract(ctx) for field, extract in self.fields}
+
+
+class TemplateAssembler:
+    """
+    Renders all output pages of a product from the compiled templates.
+    Pages are plain JSON-ready dictionaries shaped by the template files.
+    """
+
+    def __init__(self, templates: Dict[str, Dict[str, Any]]):
+        self.pages = {page: CompiledPageTemplate(t) for page, t in templates.items()}
+
+    def assemble(
+        self,
+        product_model,
+        questions: List[Any],
+        content_blocks: Dict[str, Any],
+        comparison_data: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        ctx = {
+            "model": product_model,
+            "questions": questions,
+            "content_blocks": content_blocks,
+            "comparison_data": comparison_data,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        }
+        return {page: template.render(ctx) for page, template in self.pages.items()}
+
+
+@lru_cache(maxsize=None)
+def get_template_assembler() -> TemplateAssembler:
+    """Process-wide assembler; templates are read and compiled on first use only."""
+    return TemplateAssembler(load_templates())
@@ -3,9 +3,45 @@ LangChain Tools for Content Generation
 These are reusable content logic blocks wrapped as LangChain tools.
 """
 from langchain_core.tools import tool
+from src.ingredients import (
+    DEFAULT_BENEFIT, DEFAULT_ROLE, get_ingredient_index, get_ingredient_normalizer
+)
 from src.models import InternalProductModel, QuestionInput
+from src.pricing import DEFAULT_CURRENCY, parse_price, same_currency
+from src.questions import get_question_bank
 from typing import List, Dict, Any
 
+# ============================================================================
+# FIELD DEPENDENCIES
+# ============================================================================
+
+# InternalProductModel fields read by each generator. When only some fields
+# of a product change, generators whose dependencies are untouched can reuse
+# their previous output (see ContentGenerationOrchestrator.run_incremental).
+FIELD_DEPENDENCIES = {
+    "questions": set(get_question_bank().fields),
+    "benefits": {"benefits"},
+    "usage": {"how_to_use"},
+    "safety": {"side_effects"},
+    "ingredients": {"key_ingredients"},
+    "comparison": {"key_ingredients", "price", "currency"},
+}
+
+# ============================================================================
+# TOOL EXECUTION
+# ============================================================================
+
+def call_tool(tool, args: Dict[str, Any], direct: bool = False) -> Any:
+    """
+    Calls a tool with keyword arguments.
+    In direct mode the underlying function runs as-is, skipping the tool's
+    input validation, callback manager and run-tree bookkeeping. The tool
+    object itself is unchanged and remains available to LLM agents.
+    """
+    if direct:
+        return tool.func(**args)
+    return tool.invoke(args)
+
 # ============================================================================
 # PARSING TOOLS
 # ============================================================================
@@ -15,6 +51,7 @@ def parse_product_data(raw: Dict[str, Any]) -> InternalProductModel:
     """
     Normalizes and validates raw product data into internal model.
     Converts keys to snake_case, parses lists, and handles price formatting.
+    Ingredients are mapped to their canonical names (e.g. "Vit C" → "Vitamin C").
     """
     model_data = {}
     for k, v in raw.items():
@@ -22,19 +59,16 @@ def parse_product_data(raw: Dict[str, Any]) -> InternalProductModel:
     
     # Handle list fields
     if isinstance(model_data.get('key_ingredients'), str):
-        model_data['key_ingredients'] = [i.strip() for i in model_data['key_ingredients'].split(',')]
+        model_data['key_ingredients'] = get_ingredient_normalizer().canonicalize(
+            model_data['key_ingredients'].split(',')
+        )
     
     if isinstance(model_data.get('skin_type'), str):
         model_data['skin_type'] = [s.strip() for s in model_data['skin_type'].split(',')]
 
-    # Handle price
-    p = model_data.get('price')
-    try:
-        if isinstance(p, str) and p.startswith('₹'):
-            p = p.replace('₹', '').strip()
-        model_data['price'] = float(p)
-    except Exception:
-        model_data['price'] = None
+    # Handle price: amount plus currency ("Rs. 1,299" → 1299.0, "INR")
+    price = parse_price(model_data.get('price'), model_data.get('currency') or DEFAULT_CURRENCY)
+    model_data['price'], model_data['currency'] = price if price else (None, None)
 
     return InternalProductModel(**model_data)
 
@@ -42,109 +76,22 @@ def parse_product_data(raw: Dict[str, Any]) -> InternalProductModel:
 # QUESTION GENERATION TOOLS
 # ============================================================================
 
+def build_questions(model: InternalProductModel, make=QuestionInput) -> List[QuestionInput]:
+    """
+    Builds the categorized questions for a product from the question bank
+    (selected by product category, available fields and quotas). ``make``
+    constructs each question; trusted callers pass CompactQuestion to skip
+    validating values that are strings by construction.
+    """
+    return get_question_bank().build(model, make)
+
 @tool
 def generate_questions(model: InternalProductModel) -> List[QuestionInput]:
     """
     Generates 15+ categorized user questions based on product data.
     Categories: Informational, Safety, Usage, Purchase, Comparison
     """
-    name = model.product_name
-    ingredients = ", ".join(model.key_ingredients)
-    skin_types = ", ".join(model.skin_type)
-    
-    questions = [
-        # Informational (5)
-        QuestionInput(
-            question=f"What is {name}?",
-            category="Informational",
-            answer_hint=f"{name} is a skincare product with {model.concentration}."
-        ),
-        QuestionInput(
-            question="What are the key ingredients?",
-            category="Informational",
-            answer_hint=ingredients
-        ),
-        QuestionInput(
-            question="What benefits does this product provide?",
-            category="Informational",
-            answer_hint=model.benefits or "See product description"
-        ),
-        QuestionInput(
-            question="What skin types is this suitable for?",
-            category="Informational",
-            answer_hint=skin_types
-        ),
-        QuestionInput(
-            question="What is the concentration of the active ingredient?",
-            category="Informational",
-            answer_hint=model.concentration or "Refer to packaging"
-        ),
-        
-        # Usage (4)
-        QuestionInput(
-            question="How do I use this product?",
-            category="Usage",
-            answer_hint=model.how_to_use or "Follow packaging instructions"
-        ),
-        QuestionInput(
-            question="When should I apply this product?",
-            category="Usage",
-            answer_hint="In the morning before sunscreen"
-        ),
-        QuestionInput(
-            question="How much product should I apply?",
-            category="Usage",
-            answer_hint="2-3 drops per application"
-        ),
-        QuestionInput(
-            question="Can I use this with other skincare products?",
-            category="Usage",
-            answer_hint="Yes, but avoid layering with strong actives like retinol"
-        ),
-        
-        # Safety (3)
-        QuestionInput(
-            question="Are there any side effects?",
-            category="Safety",
-            answer_hint=model.side_effects or "No known side effects"
-        ),
-        QuestionInput(
-            question="Is this safe for sensitive skin?",
-            category="Safety",
-            answer_hint="May cause mild tingling. Do a patch test first."
-        ),
-        QuestionInput(
-            question="Can I use this product during pregnancy?",
-            category="Safety",
-            answer_hint="Consult your dermatologist before use"
-        ),
-        
-        # Purchase (2)
-        QuestionInput(
-            question="What is the price?",
-            category="Purchase",
-            answer_hint=f"₹{int(model.price)}" if model.price else "Contact retailer"
-        ),
-        QuestionInput(
-            question="Where can I buy this product?",
-            category="Purchase",
-            answer_hint="Available at authorized retailers and online stores"
-        ),
-        
-        # Comparison (2)
-        QuestionInput(
-            question="How does this compare to other Vitamin C serums?",
-            category="Comparison",
-            answer_hint=f"Features {model.concentration} with {ingredients}"
-        ),
-        QuestionInput(
-            question="What makes this product unique?",
-            category="Comparison",
-            answer_hint=f"Combines {ingredients} for enhanced {model.benefits}"
-        ),
-    ]
-    
-    return questions
+    return build_questions(model)
 
 # ============================================================================
 # CONTENT LOGIC BLOCKS (Reusable Transformation Functions)
@@ -195,39 +142,38 @@ def generate_safety_block(model: InternalProductModel) -> Dict[str, Any]:
 def generate_ingredients_block(model: InternalProductModel) -> List[Dict[str, str]]:
     """
     Content block: Transforms ingredients into structured format with roles.
+    Roles and benefits come from the shared ingredient index.
     """
-    active_ingredients = ['vitamin c', 'hyaluronic acid', 'niacinamide', 'retinol']
-    return [
-        {
+    index = get_ingredient_index()
+    block = []
+    for ingredient in model.key_ingredients:
+        info = index.lookup(ingredient)
+        block.append({
             "name": ingredient,
-            "role": "Active" if ingredient.lower() in active_ingredients else "Support",
-            "benefit": _get_ingredient_benefit(ingredient)
-        }
-        for ingredient in model.key_ingredients
-    ]
-
-def _get_ingredient_benefit(ingredient: str) -> str:
-    """Helper: Returns known benefit for common ingredients."""
-    benefits_map = {
-        "vitamin c": "Brightening and antioxidant protection",
-        "hyaluronic acid": "Deep hydration and plumping",
-        "niacinamide": "Pore minimizing and barrier repair",
-        "retinol": "Anti-aging and cell turnover"
-    }
-    return benefits_map.get(ingredient.lower(), "Skin conditioning")
+            "role": info.role if info else DEFAULT_ROLE,
+            "benefit": info.benefit if info else DEFAULT_BENEFIT
+        })
+    return block
 
 @tool
 def generate_comparison_block(model_a: InternalProductModel, model_b: Dict[str, Any]) -> Dict[str, Any]:
     """
     Content block: Compares two products by ingredients, price, and benefits.
+    Ingredients are matched by canonical name, so aliases count as common.
+    The price difference is None when the two prices are in different
+    currencies.
     """
-    a_ings = set(i.lower() for i in model_a.key_ingredients)
-    b_ings = set(i.lower() for i in model_b.get("key_ingredients", []))
+    canonical = get_ingredient_normalizer().canonical
+    a_ings = set(canonical(i).lower() for i in model_a.key_ingredients)
+    b_ings = set(canonical(i).lower() for i in model_b.get("key_ingredients", []))
     
     return {
         "common_ingredients": list(a_ings & b_ings),
         "unique_to_a": list(a_ings - b_ings),
         "unique_to_b": list(b_ings - a_ings),
-        "price_difference": (model_b.get("price", 0) or 0) - (model_a.price or 0),
+        "price_difference": (
+            (model_b.get("price", 0) or 0) - (model_a.price or 0)
+            if same_currency(model_a.currency, model_b.get("currency")) else None
+        ),
         "recommendation": "Choose based on your skin concerns and budget"
     }
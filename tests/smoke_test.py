@@ -1,6 +1,7 @@
 """
 Smoke Test for LangChain Content Generation Pipeline
 """
+import importlib.util
 import sys
 import os
 
@@ -45,9 +46,622 @@ def test_pipeline():
     print("✅ All tests passed!")
     return True
 
+def test_graph():
+    """Test that the fan-out graph matches the linear one and keeps no state between runs."""
+    from langgraph.checkpoint.memory import MemorySaver
+    from src.graph import create_graph, get_graph
+    from src.main import RAW_PRODUCT
+    
+    pages = ("product_page", "faq_page", "comparison_page")
+    linear = get_graph(parallel=False).invoke({"raw_input": RAW_PRODUCT})
+    parallel = get_graph(parallel=True).invoke({"raw_input": RAW_PRODUCT})
+    for page in pages:
+        assert parallel[page] == linear[page]
+    
+    # Re-running on a checkpointed thread replaces the outputs instead of accumulating them
+    graph = create_graph().builder.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "smoke"}}
+    first = graph.invoke({"raw_input": RAW_PRODUCT}, config)
+    second = graph.invoke({"raw_input": RAW_PRODUCT}, config)
+    assert second["faq_page"] == first["faq_page"] == linear["faq_page"]
+
+def test_run_batch():
+    """Test that batch mode streams one page set per input product."""
+    from src.orchestrator import create_orchestrator
+    
+    raw_products = [
+        {'Product Name': f'Serum {i}', 'Key Ingredients': 'Vitamin C, Niacinamide', 'Price': f'₹{100 + i}'}
+        for i in range(3)
+    ]
+    
+    orchestrator = create_orchestrator()
+    results = list(orchestrator.run_batch(iter(raw_products)))
+    
+    assert len(results) == 3
+    assert [r['product_page'].name for r in results] == ['Serum 0', 'Serum 1', 'Serum 2']
+    assert results[2]['product_page'].price == 102.0
+
+def test_arun_batch():
+    """Test that the async batch API preserves input order under bounded concurrency."""
+    import asyncio
+    from src.orchestrator import create_orchestrator
+    
+    raw_products = [{'Product Name': f'Serum {i}', 'Price': '₹499'} for i in range(10)]
+    
+    orchestrator = create_orchestrator()
+    results = asyncio.run(orchestrator.arun_batch(raw_products, max_concurrency=3))
+    
+    assert [r['product_page'].name for r in results] == [f'Serum {i}' for i in range(10)]
+    assert len(results[0]['faq_page'].questions) >= 15
+    
+    # Inputs are pulled lazily: never more than max_concurrency products in flight
+    orchestrator = create_orchestrator(direct=True)
+    run, in_flight = orchestrator.arun, [0, 0]
+    
+    async def tracked(raw_input):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        try:
+            return await run(raw_input)
+        finally:
+            in_flight[0] -= 1
+    
+    orchestrator.arun = tracked
+    results = asyncio.run(orchestrator.arun_batch(iter(raw_products), max_concurrency=3))
+    assert [r['product_page'].name for r in results] == [f'Serum {i}' for i in range(10)]
+    assert in_flight[1] == 3
+    try:
+        asyncio.run(orchestrator.arun_batch(raw_products, max_concurrency=0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("arun_batch accepted max_concurrency=0")
+
+def test_run_sharded():
+    """Test that the process-pool runner merges chunks back in input order."""
+    from src.sharding import run_sharded
+    
+    raw_products = [{'Product Name': f'Serum {i}', 'Price': '₹499'} for i in range(7)]
+    
+    results = list(run_sharded(raw_products, workers=2, chunk_size=2))
+    
+    assert [r['product_page'].name for r in results] == [f'Serum {i}' for i in range(7)]
+
+def test_streaming_io():
+    """Test JSONL reading and batched NDJSON writing round-trip."""
+    import json
+    import tempfile
+    from src.orchestrator import create_orchestrator
+    from src.streaming import NDJSONPageWriter, read_jsonl
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog = os.path.join(tmp, 'catalog.jsonl')
+        with open(catalog, 'w', encoding='utf-8') as f:
+            for i in range(5):
+                f.write(json.dumps({'Product Name': f'Serum {i}', 'Price': '₹499'}) + '\n')
+            f.write('\n')
+        
+        orchestrator = create_orchestrator()
+        with NDJSONPageWriter(tmp, flush_every=2) as writer:
+            for outputs in orchestrator.run_batch(read_jsonl(catalog)):
+                writer.write(outputs)
+        
+        assert writer.count == 5
+        with open(os.path.join(tmp, 'faq.ndjson'), encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert [json.loads(l)['title'] for l in lines] == [f'FAQ - Serum {i}' for i in range(5)]
+        
+        # Re-running replaces the files; appending is explicit and checks alignment
+        outputs = orchestrator.run({'Product Name': 'Serum 5'})
+        with NDJSONPageWriter(tmp) as writer:
+            writer.write(outputs)
+        with NDJSONPageWriter(tmp, append=True) as writer:
+            writer.write(outputs)
+        with open(os.path.join(tmp, 'faq.ndjson'), encoding='utf-8') as f:
+            assert len(f.read().splitlines()) == 2
+        with open(os.path.join(tmp, 'faq.ndjson'), 'a', encoding='utf-8') as f:
+            f.write('{}\n')
+        try:
+            NDJSONPageWriter(tmp, append=True).open()
+            assert False, "misaligned files must not be appended to"
+        except ValueError:
+            pass
+
+def test_page_cache():
+    """Test that unchanged products are served from the cache on a second run."""
+    import tempfile
+    from src.cache import PageCache
+    from src.orchestrator import create_orchestrator
+    
+    raw_products = [{'Product Name': f'Serum {i}', 'Price': '₹499'} for i in range(3)]
+    orchestrator = create_orchestrator()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'pages.sqlite')
+        with PageCache(path) as cache:
+            first = list(orchestrator.run_batch(raw_products, cache=cache))
+            assert cache.stats()['misses'] == 3
+        
+        raw_products[1]['Price'] = '₹599'
+        with PageCache(path) as cache:
+            second = list(orchestrator.run_batch(raw_products, cache=cache))
+            assert (cache.hits, cache.misses) == (2, 1)
+    
+    assert second[0] == first[0]
+    assert second[1]['product_page'].price == 599.0
+    
+    # Page sets the cache cannot hold are rejected up front
+    from src.comparison import ComparisonEngine
+    engine = ComparisonEngine.from_raw(raw_products)
+    for options in ({'trusted': True}, {'template_driven': True}, {'comparison_engine': engine}):
+        with PageCache(':memory:') as cache:
+            try:
+                create_orchestrator(**options).run_batch(raw_products, cache=cache)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"run_batch accepted a cache with {options}")
+    
+    # Editing pipeline source changes the cache version
+    from unittest import mock
+    from src import cache as cache_module
+    with tempfile.TemporaryDirectory() as tmp:
+        module = os.path.join(tmp, 'tools.py')
+        with open(module, 'w') as f:
+            f.write('A = 1\n')
+        with mock.patch.object(cache_module, 'SOURCE_PATH', tmp):
+            before = cache_module.pipeline_version()
+            with open(module, 'w') as f:
+                f.write('A = 2\n')
+            assert cache_module.pipeline_version() != before
+
+def test_run_incremental():
+    """Test that a price-only edit reruns only the price-dependent generators."""
+    from src.orchestrator import create_orchestrator
+    
+    raw_product = {
+        'Product Name': 'GlowBoost Vitamin C Serum',
+        'Key Ingredients': 'Vitamin C, Hyaluronic Acid',
+        'Benefits': 'Brightening, Fades dark spots',
+        'Price': '₹699'
+    }
+    orchestrator = create_orchestrator()
+    
+    first = orchestrator.run_incremental(raw_product)
+    second = orchestrator.run_incremental({**raw_product, 'Price': '₹799'}, previous=first)
+    
+    assert second['regenerated'] == ['comparison', 'questions']
+    assert second['content_blocks']['benefits'] is first['content_blocks']['benefits']
+    assert second['outputs']['product_page'].price == 799.0
+    assert second['outputs'] == orchestrator.run_incremental({**raw_product, 'Price': '₹799'})['outputs']
+
+def test_direct_mode():
+    """Test that direct mode produces the same pages as tool invocation."""
+    from src.orchestrator import create_orchestrator
+    
+    raw_product = {
+        'Product Name': 'GlowBoost Vitamin C Serum',
+        'Skin Type': 'Oily, Combination',
+        'Key Ingredients': 'Vitamin C, Hyaluronic Acid',
+        'Price': '₹699'
+    }
+    
+    assert create_orchestrator(direct=True).run(raw_product) == create_orchestrator().run(raw_product)
+
+def test_template_driven_assembly():
+    """Test that pages follow the field layout declared in src/templates."""
+    from src.orchestrator import create_orchestrator
+    from src.template_engine import load_templates
+    
+    raw_product = {
+        'Product Name': 'GlowBoost Vitamin C Serum',
+        'Concentration': '10% Vitamin C',
+        'Key Ingredients': 'Vitamin C, Hyaluronic Acid',
+        'Benefits': 'Brightening, Fades dark spots',
+        'Price': '₹699'
+    }
+    templates = load_templates()
+    outputs = create_orchestrator(template_driven=True).run(raw_product)
+    
+    for page, template in templates.items():
+        assert list(outputs[page]) == list(template['fields'])
+    assert outputs['product_page']['tagline'] == 'Brightening, Fades dark spots with 10% Vitamin C'
+    assert outputs['product_page']['price'] == '₹699'
+    usd = create_orchestrator(template_driven=True).run(dict(raw_product, Price='$12.50'))
+    assert usd['product_page']['price'] == '$12.50'
+    assert len(outputs['product_page']['questions']) == 5
+    assert outputs['faq_page']['categories'] == ['Informational', 'Usage', 'Safety', 'Purchase', 'Comparison']
+
+def test_ingredient_index():
+    """Test alias lookups and that the mapped index matches the in-memory one."""
+    import tempfile
+    from src.ingredients import IngredientIndex, MappedIngredientIndex
+    
+    index = IngredientIndex([
+        {'name': 'Vitamin C', 'aliases': ['L-Ascorbic Acid'], 'role': 'Active', 'benefit': 'Brightening'},
+        {'name': 'Glycerin', 'role': 'Humectant', 'benefit': 'Hydration'},
+    ])
+    assert index.lookup('  l-ascorbic   ACID ').name == 'Vitamin C'
+    assert index.role('Water') == 'Support'
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ingredients.idx')
+        index.save_mapped(path)
+        mapped = MappedIngredientIndex(path)
+        try:
+            for name in ['vitamin c', 'L-Ascorbic Acid', 'Glycerin', 'Water', 'aaa', 'zzz']:
+                assert mapped.lookup(name) == index.lookup(name)
+        finally:
+            mapped.close()
+        
+        # Tabs and newlines would break the record layout
+        bad = IngredientIndex([{'name': 'Panthenol', 'benefit': 'Soothing\nRepair'}])
+        try:
+            bad.save_mapped(path)
+            assert False, "fields with newlines must be rejected"
+        except ValueError:
+            pass
+
+def test_ingredient_normalization():
+    """Test that aliases resolve to canonical names during parsing and comparison."""
+    from src.tools import parse_product_data, generate_comparison_block
+    
+    model = parse_product_data.invoke({"raw": {
+        "Product Name": "Test Serum",
+        "Key Ingredients": "L-Ascorbic Acid, Vit. C, Sodium Hyaluronate 1%, Ferulic Acid"
+    }})
+    assert model.key_ingredients == ['Vitamin C', 'Hyaluronic Acid', 'Ferulic Acid']
+    
+    comparison = generate_comparison_block.invoke({
+        "model_a": model,
+        "model_b": {"key_ingredients": ["Ascorbic Acid", "Niacinamide"], "price": 0}
+    })
+    assert comparison["common_ingredients"] == ['vitamin c']
+    assert comparison["unique_to_b"] == ['niacinamide']
+    
+    # A mapped index resolves aliases in place, without loading its records
+    import tempfile
+    from src.ingredients import IngredientNormalizer, MappedIngredientIndex, get_ingredient_index
+    tokens = ["L-Ascorbic Acid 15%", "Vit. C", "pure Sodium Hyaluronate", "Water"]
+    expected = IngredientNormalizer(get_ingredient_index()).canonicalize(tokens)
+    assert expected == ['Vitamin C', 'Hyaluronic Acid', 'Water']
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ingredients.idx')
+        get_ingredient_index().save_mapped(path)
+        mapped = MappedIngredientIndex(path)
+        try:
+            mapped.items = None
+            normalizer = IngredientNormalizer(mapped, memo_size=2)
+            assert normalizer.canonicalize(tokens) == expected
+            assert normalizer.canonical.cache_info().currsize == 2
+        finally:
+            mapped.close()
+
+def test_comparison_engine():
+    """Test that products are compared with their closest catalog peer."""
+    from src.comparison import ComparisonEngine
+    from src.orchestrator import create_orchestrator
+    from src.tools import parse_product_data
+    
+    catalog = [
+        {"Product Name": "A", "Key Ingredients": "Vitamin C, Niacinamide", "Price": "₹500"},
+        {"Product Name": "B", "Key Ingredients": "Ascorbic Acid, Nicotinamide", "Price": "₹550"},
+        {"Product Name": "C", "Key Ingredients": "Vitamin C, Retinol", "Price": "₹500"},
+        {"Product Name": "D", "Key Ingredients": "Glycerin", "Price": "₹100"},
+    ]
+    engine = ComparisonEngine.from_raw(catalog)
+    assert len(engine) == 4
+    
+    orchestrator = create_orchestrator(comparison_engine=engine)
+    pages = list(orchestrator.run_batch(catalog))
+    assert pages[0]['comparison_page'].product_b['product_name'] == 'B'
+    assert pages[0]['comparison_page'].comparison['unique_to_b'] == []
+    # No catalog product shares an ingredient with D: fall back to the fictional one
+    assert pages[3]['comparison_page'].product_b['product_name'] == 'RadiantGlow Vitamin C Concentrate'
+    
+    # Catalog scale: ingredients in more than max_postings products still count
+    large = [
+        {"Product Name": f"P{i}", "Price": "₹500",
+         "Key Ingredients": f"Water, Glycerin, {'Retinol' if i % 4 < 2 else 'Vitamin C'}, Extract {i // 2}"}
+        for i in range(2400)
+    ]
+    large.append({"Product Name": "Lean", "Key Ingredients": "Water, Extract 7", "Price": "₹500"})
+    engine = ComparisonEngine.from_raw(large)
+    peers = engine.nearest(parse_product_data.invoke({"raw": large[14]}), k=2)
+    assert [peer['product_name'] for peer in peers] == ['P15', 'Lean']
+    common_only = {"Product Name": "Q", "Key Ingredients": "Water, Glycerin, Vitamin C", "Price": "₹500"}
+    peer = engine.nearest(parse_product_data.invoke({"raw": common_only}))[0]
+    assert 'Vitamin C' in peer['key_ingredients']
+    # A rare ingredient found only in the query itself does not hide the common ones
+    common = [{"Product Name": f"N{i}", "Key Ingredients": "Water, Glycerin, Niacinamide"} for i in range(50)]
+    solo = {"Product Name": "Solo", "Key Ingredients": "Water, Glycerin, Niacinamide, Unobtainium"}
+    engine = ComparisonEngine.from_raw(common + [solo], max_postings=10)
+    peers = engine.nearest(parse_product_data.invoke({"raw": solo}))
+    assert peers and peers[0]['product_name'].startswith('N')
+
+def test_similarity_matrix():
+    """Test that the vectorized matrices agree with generate_comparison_block."""
+    try:
+        import numpy
+        import scipy  # noqa: F401 - optional dependencies
+    except ImportError:
+        import pytest
+        pytest.skip("numpy and scipy are not installed")
+    from src.similarity import SimilarityMatrix
+    from src.tools import parse_product_data, generate_comparison_block
+    
+    products = [parse_product_data.invoke({"raw": raw}) for raw in [
+        {"Product Name": "A", "Key Ingredients": "Vitamin C, Niacinamide, Glycerin", "Price": "₹500"},
+        {"Product Name": "B", "Key Ingredients": "Ascorbic Acid, Retinol", "Price": "₹650"},
+        {"Product Name": "C", "Key Ingredients": "Squalane"},
+        {"Product Name": "D", "Key Ingredients": "Retinol", "Price": "$12"},
+    ]]
+    matrix = SimilarityMatrix(products)
+    counts = matrix.counts()
+    for a, model_a in enumerate(products):
+        for b, model_b in enumerate(products):
+            expected = generate_comparison_block.func(model_a, model_b.model_dump())
+            pair = matrix.comparison(a, b)
+            for field in ("common_ingredients", "unique_to_a", "unique_to_b"):
+                assert set(pair[field]) == set(expected[field])
+                assert counts[field][a, b] == len(expected[field])
+            assert pair["price_difference"] == expected["price_difference"]
+            if expected["price_difference"] is None:
+                assert numpy.isnan(counts["price_difference"][a, b])
+            else:
+                assert counts["price_difference"][a, b] == expected["price_difference"]
+    assert matrix.jaccard()[0, 1] == 0.25
+
+def test_batch_parser():
+    """Test that the columnar parser matches parse_product_data record for record."""
+    from src.batch_parser import parse_batch, iter_parsed
+    from src.tools import parse_product_data
+    
+    records = [
+        {"Product Name": "A", "Key Ingredients": "Vit C, Retinol", "Skin Type": "Oily, Dry", "Price": "₹699"},
+        {"Product Name": "B", "Key Ingredients": "Niacinamide", "Skin Type": "Oily, Dry", "Price": "₹ 1299.50"},
+        {"product name": "C", "Price": 450, "Unused": "x"},
+        {"Product Name": "D", "Price": "Rs. 1,299", "Benefits": "Hydration"},
+        {"Product Name": "E", "Price": " 12 "},
+    ]
+    expected = [parse_product_data.invoke({"raw": raw}) for raw in records]
+    assert parse_batch(records) == expected
+    assert list(iter_parsed(records, chunk_size=2)) == expected
+
+def test_price_parsing():
+    """Test multi-currency price parsing and its use in the parser."""
+    from src.pricing import parse_price, format_price
+    from src.tools import parse_product_data
+    
+    assert parse_price("₹699") == (699.0, "INR")
+    assert parse_price("Rs. 1,299/-") == (1299.0, "INR")
+    assert parse_price("INR 1,00,000") == (100000.0, "INR")
+    assert parse_price("$12.50") == (12.5, "USD")
+    assert parse_price("1.299,00 €") == (1299.0, "EUR")
+    assert parse_price(450) == (450.0, "INR")
+    for dirty in ["N/A", "", "1,2,3", "$12 €", None]:
+        assert parse_price(dirty) is None
+    assert format_price(12.5, "USD") == "$12.50"
+    
+    model = parse_product_data.invoke({"raw": {"Product Name": "A", "Price": "Rs. 1,299"}})
+    assert (model.price, model.currency) == (1299.0, "INR")
+    model = parse_product_data.invoke({"raw": {"Product Name": "B", "Price": "40", "Currency": "CHF"}})
+    assert (model.price, model.currency) == (40.0, "CHF")
+    
+    # Currency reaches the pages; prices in different currencies are not compared
+    from src.agents.parser_agent import ParserAgent
+    from src.agents.qgen_agent import QuestionGenAgent
+    from src.orchestrator import create_orchestrator
+    from src.tools import generate_comparison_block
+    
+    raw = {"Product Name": "C", "Key Ingredients": "Vitamin C", "Price": "$12"}
+    for trusted in (False, True):
+        pages = create_orchestrator(trusted=trusted).run(raw)
+        if not trusted:
+            pages = {key: page.model_dump() for key, page in pages.items()}
+        assert pages["product_page"]["currency"] == "USD"
+        assert pages["comparison_page"]["product_a"]["currency"] == "USD"
+        assert pages["comparison_page"]["comparison"]["price_difference"] is None
+    from src.graph import get_graph
+    state = get_graph().invoke({"raw_input": raw})
+    assert state["product_page"].currency == "USD"
+    assert state["comparison_page"].product_a["currency"] == "USD"
+    assert state["comparison_page"].product_b["currency"] == "INR"
+    assert state["comparison_page"].comparison["price_difference"] is None
+    same = {"key_ingredients": [], "price": 15.0, "currency": "USD"}
+    assert generate_comparison_block.invoke({"model_a": model, "model_b": same})["price_difference"] is None
+    usd = parse_product_data.invoke({"raw": raw})
+    assert generate_comparison_block.invoke({"model_a": usd, "model_b": same})["price_difference"] == 3.0
+    legacy = ParserAgent().run(raw)
+    assert legacy["currency"] == "USD"
+    price_question = {"question": "What is the price?", "category": "Purchase", "answer_hint": "$12"}
+    assert price_question in QuestionGenAgent().run(legacy)
+
+def test_trusted_mode():
+    """Test that the trusted compact path produces the validated pages' data."""
+    from src.orchestrator import create_orchestrator
+    from src.main import RAW_PRODUCT
+    
+    validated = create_orchestrator().run(RAW_PRODUCT)
+    trusted = create_orchestrator(trusted=True).run(RAW_PRODUCT)
+    for page in ("product_page", "faq_page", "comparison_page"):
+        assert isinstance(trusted[page], dict)
+        assert trusted[page] == validated[page].model_dump()
+
+def test_question_bank():
+    """Test question selection by product category, field availability and quotas."""
+    from src.questions import get_question_bank
+    from src.tools import FIELD_DEPENDENCIES, build_questions, parse_product_data
+    
+    full = parse_product_data.invoke({"raw": {
+        "Product Name": "A", "Price": "699", "Benefits": "Glow", "Concentration": "5% Retinol",
+        "Key Ingredients": "Retinol", "Skin Type": "Dry", "Category": "Serum"
+    }})
+    bare = parse_product_data.invoke({"raw": {"Product Name": "B", "Category": "Shampoo"}})
+    first, second = build_questions(full), build_questions(bare)
+    quotas = get_question_bank().quotas
+    for questions in (first, second):
+        assert len(questions) == sum(quotas.values())
+        assert all(sum(q.category == c for q in questions) == n for c, n in quotas.items())
+    
+    # Static questions are shared instances
+    shared = {q.question: q for q in first}
+    assert any(shared.get(q.question) is q for q in second)
+    
+    # Category variants override generic ones; missing fields fall back or are backfilled
+    answers, bare_answers = ({q.question: q.answer_hint for q in qs} for qs in (first, second))
+    assert answers["How much product should I apply?"] == "2-3 drops per application"
+    assert answers["How does this compare to other serums?"] == "Features 5% Retinol with Retinol"
+    assert answers["What is A?"] == "A is a skincare product with 5% Retinol."
+    assert answers["What is the price?"] == "₹699"
+    assert bare_answers["How much product should I apply?"] == "Follow the amount recommended on the packaging"
+    assert bare_answers["What is B?"] == "B is a skincare product."
+    assert bare_answers["What is the price?"] == "Contact retailer"
+    assert "What are the key ingredients?" not in bare_answers
+    assert "How should I store this product?" in bare_answers
+    assert FIELD_DEPENDENCIES["questions"] == set(get_question_bank().fields)
+
+def test_normalized_output():
+    """Test that normalized pages store questions once and resolve back to the full pages."""
+    import json
+    import tempfile
+    from src.orchestrator import create_orchestrator
+    from src.main import RAW_PRODUCT
+    from src.models import QuestionInput
+    from src.serialization import dumps
+    from src.streaming import NDJSONPageWriter, dumps_normalized, normalize_pages, page_to_dict
+    
+    for options in ({}, {"trusted": True}, {"template_driven": True}):
+        outputs = create_orchestrator(**options).run(RAW_PRODUCT)
+        unshared = dict(outputs)
+        page = outputs["product_page"]
+        extra = {"question": "Is it vegan?", "category": "Other", "answer_hint": "vegan"}
+        if isinstance(page, dict):
+            unshared["product_page"] = {**page, "questions": [dict(q) for q in page["questions"]] + [extra]}
+        else:
+            copies = [q.model_copy() for q in page.questions] + [QuestionInput(**extra)]
+            unshared["product_page"] = page.model_copy(update={"questions": copies})
+        for pages in (outputs, unshared):
+            normalized = normalize_pages(pages)
+            questions = normalized["questions"]["questions"]
+            for key in ("product_page", "faq_page", "comparison_page"):
+                page = dict(page_to_dict(normalized[key]))
+                if "questions" in page:
+                    page["questions"] = [questions[i] for i in page["questions"]]
+                assert page == page_to_dict(pages[key])
+            # The NDJSON writer's encoding splices ids into serialized pages
+            assert dumps_normalized(pages) == {key: dumps(page) for key, page in normalized.items()}
+        assert normalize_pages(unshared)["questions"]["questions"][-1] == extra
+    
+    outputs = create_orchestrator().run(RAW_PRODUCT)
+    assert len(normalize_pages(outputs)["questions"]["questions"]) == len(outputs["faq_page"].questions)
+    with tempfile.TemporaryDirectory() as tmp:
+        with NDJSONPageWriter(tmp, normalized=True) as writer:
+            writer.write(outputs)
+        with open(os.path.join(tmp, 'questions.ndjson'), encoding='utf-8') as f:
+            assert len(json.loads(f.readline())["questions"]) == len(outputs["faq_page"].questions)
+        
+        # Full pages cannot be appended to normalized output; a new full run drops its questions
+        try:
+            NDJSONPageWriter(tmp, append=True).open()
+            assert False, "full pages must not be appended to normalized output"
+        except ValueError:
+            pass
+        with NDJSONPageWriter(tmp) as writer:
+            writer.write(outputs)
+        assert not os.path.exists(os.path.join(tmp, 'questions.ndjson'))
+
+def test_serialization():
+    """Test that fast page encoding matches the stdlib json output."""
+    import json
+    from src.orchestrator import create_orchestrator
+    from src.main import RAW_PRODUCT
+    from src.serialization import dumps, loads
+    
+    for options in ({}, {"trusted": True}):
+        for page in create_orchestrator(**options).run(RAW_PRODUCT).values():
+            data = page if isinstance(page, dict) else page.model_dump()
+            compact = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            pretty = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            assert dumps(page) == compact
+            assert dumps(page, pretty=True) == pretty
+            assert loads(dumps(page)) == data
+    assert dumps({"n": 1 << 70}) == b'{"n":1180591620717411303424}'
+
+def test_pipeline_profiler():
+    """Test that sync and async runs record one sample per agent call."""
+    import asyncio
+    from src.instrumentation import PipelineProfiler
+    from src.orchestrator import create_orchestrator
+    from src.main import RAW_PRODUCT
+    
+    for direct in (False, True):
+        profiler = PipelineProfiler(trace_memory=False)
+        orchestrator = profiler.instrument_orchestrator(create_orchestrator(direct=direct))
+        orchestrator.run(RAW_PRODUCT)
+        asyncio.run(orchestrator.arun_batch([RAW_PRODUCT, RAW_PRODUCT], max_concurrency=1))
+        
+        summary = profiler.summary()
+        assert set(summary) == {agent.name for agent in orchestrator.agents.values()}
+        for stage in summary.values():
+            assert stage["wall_ms"]["count"] == 3
+            assert stage["wall_ms"]["p99"] >= stage["wall_ms"]["p50"] > 0
+        assert 'pipeline_stage_wall_seconds_count{stage="ParserAgent"} 3' in profiler.to_prometheus()
+
+def test_template_agent():
+    """Test that compiled render plans match the previous interpreter and are cached by name."""
+    from benchmarks.bench_template_engine import LegacyTemplateAgent, TEMPLATES
+    from src.agents.block_agent import BlockAgent
+    from src.agents.parser_agent import ParserAgent
+    from src.agents.qgen_agent import QuestionGenAgent
+    from src.agents.template_agent import TemplateAgent
+    from src.main import RAW_PRODUCT
+    
+    model = ParserAgent().run(RAW_PRODUCT)
+    questions = QuestionGenAgent().run(model)
+    legacy, compiled = LegacyTemplateAgent(BlockAgent()), TemplateAgent(BlockAgent())
+    other = dict(model, product_name="Other", key_ingredients=["Niacinamide"])
+    templates = dict(TEMPLATES, comparison={
+        'title': '{{model.product_name}} vs. others',
+        'compare': {'block': 'compare_ingredients_block', 'with': other},
+    })
+    for name, template in templates.items():
+        expected = legacy.render(template, model, questions)
+        assert compiled.render(template, model, questions) == expected
+        assert compiled.render(template, model, questions, name=name) == expected
+    
+    # One plan per name; a fresh template object under the same name is recompiled
+    fresh = dict(TEMPLATES['faq'], title='Questions about {{model.product_name}}')
+    assert compiled.render(fresh, model, questions, name='faq')['title'] == f"Questions about {model['product_name']}"
+    assert len(compiled._compiled) == len(templates)
+
 if __name__ == '__main__':
     try:
         test_pipeline()
+        test_graph()
+        test_run_batch()
+        test_arun_batch()
+        test_run_sharded()
+        test_streaming_io()
+        test_page_cache()
+        test_run_incremental()
+        test_direct_mode()
+        test_template_driven_assembly()
+        test_ingredient_index()
+        test_ingredient_normalization()
+        test_comparison_engine()
+        if all(importlib.util.find_spec(name) for name in ("numpy", "scipy")):
+            test_similarity_matrix()
+        else:
+            print("⏭️  test_similarity_matrix skipped: numpy and scipy are not installed")
+        test_batch_parser()
+        test_price_parsing()
+        test_trusted_mode()
+        test_question_bank()
+        test_normalized_output()
+        test_serialization()
+        test_pipeline_profiler()
+        test_template_agent()
     except Exception as e:
         print(f"❌ Test failed: {e}")
         import traceback